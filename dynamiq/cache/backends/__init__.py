@@ -1,2 +1,3 @@
 from .base import BaseCache
+from .memory import InMemoryCache
 from .redis import RedisCache
@@ -0,0 +1,95 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+from dynamiq.cache.backends import BaseCache
+from dynamiq.cache.config import InMemoryCacheConfig
+
+
+class InMemoryCache(BaseCache):
+    """In-process LRU cache backend implementation.
+
+    Entries are stored as `(value, expires_at)` pairs in an ordered dict guarded by a lock,
+    so a single instance can be shared between threads.
+
+    Attributes:
+        client (OrderedDict): Storage for cache entries.
+        max_size (int): Maximum number of entries.
+    """
+
+    def __init__(self, client: OrderedDict | None = None, max_size: int = 1024):
+        """Initialize InMemoryCache.
+
+        Args:
+            client (OrderedDict | None): Storage for cache entries.
+            max_size (int): Maximum number of entries.
+        """
+        super().__init__(client=client if client is not None else OrderedDict())
+        self.max_size = max_size
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: InMemoryCacheConfig):
+        """Create InMemoryCache instance from configuration.
+
+        Args:
+            config (InMemoryCacheConfig): In-memory cache configuration.
+
+        Returns:
+            InMemoryCache: In-memory cache instance.
+        """
+        return cls(max_size=config.max_size)
+
+    def get(self, key: str) -> Any:
+        """Retrieve value from in-memory cache.
+
+        Args:
+            key (str): Cache key.
+
+        Returns:
+            Any: Cached value or None if missing or expired.
+        """
+        with self._lock:
+            entry = self.client.get(key)
+            if entry is None:
+                return None
+
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self.client[key]
+                return None
+
+            self.client.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: int | None = None) -> bool:
+        """Set value in in-memory cache.
+
+        Args:
+            key (str): Cache key.
+            value (Any): Value to cache.
+            ttl (int | None): Time-to-live for cache entry in seconds.
+
+        Returns:
+            bool: True when the value is stored.
+        """
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            self.client[key] = (value, expires_at)
+            self.client.move_to_end(key)
+            while len(self.client) > self.max_size:
+                self.client.popitem(last=False)
+        return True
+
+    def delete(self, key: str) -> int:
+        """Delete value from in-memory cache.
+
+        Args:
+            key (str): Cache key.
+
+        Returns:
+            int: Number of deleted entries.
+        """
+        with self._lock:
+            return 1 if self.client.pop(key, None) is not None else 0
@@ -8,6 +8,7 @@ from dynamiq.connections import RedisConnection
 class CacheBackend(enum.Enum):
     """Enumeration for cache backends."""
     Redis = "Redis"
+    InMemory = "InMemory"
 
 
 class CacheConfig(BaseModel):
@@ -41,3 +42,14 @@ class RedisCacheConfig(CacheConfig, RedisConnection):
         backend (Literal[CacheBackend.Redis]): The Redis cache backend.
     """
     backend: Literal[CacheBackend.Redis] = CacheBackend.Redis
+
+
+class InMemoryCacheConfig(CacheConfig):
+    """Configuration for in-process cache.
+
+    Attributes:
+        backend (Literal[CacheBackend.InMemory]): The in-memory cache backend.
+        max_size (int): Maximum number of entries kept before least recently used ones are evicted.
+    """
+    backend: Literal[CacheBackend.InMemory] = CacheBackend.InMemory
+    max_size: int = 1024
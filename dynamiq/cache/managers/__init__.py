@@ -1,2 +1,3 @@
 from .base import CacheManager
+from .response import ResponseCacheManager
 from .workflow import WorkflowCacheManager
@@ -1,6 +1,6 @@
 from typing import Any, Callable
 
-from dynamiq.cache.backends import BaseCache, RedisCache
+from dynamiq.cache.backends import BaseCache, InMemoryCache, RedisCache
 from dynamiq.cache.codecs import Base64Codec
 from dynamiq.cache.config import CacheBackend, CacheConfig
 from dynamiq.components.serializers import JsonSerializer
@@ -20,6 +20,7 @@ class CacheManager:
     """
     CACHE_BACKENDS_BY_TYPE: dict[CacheBackend, BaseCache] = {
         CacheBackend.Redis: RedisCache,
+        CacheBackend.InMemory: InMemoryCache,
     }
 
     def __init__(
@@ -0,0 +1,118 @@
+import hashlib
+import json
+from typing import Any
+
+from dynamiq.cache.config import CacheConfig
+from dynamiq.cache.managers import CacheManager
+
+
+class ResponseCacheManager(CacheManager):
+    """Manager for caching LLM responses produced for agent prompts.
+
+    Attributes:
+        DEFAULT_TTL (int): Time-to-live used when config does not define one.
+        TOOL_TRACE_NAMESPACE (str): Namespace suffix for tool call traces.
+        hits (int): Number of cache hits.
+        misses (int): Number of cache misses.
+    """
+
+    DEFAULT_TTL: int = 3600
+    TOOL_TRACE_NAMESPACE: str = "tool_trace"
+
+    def __init__(
+        self,
+        config: CacheConfig,
+        serializer: Any | None = None,
+    ):
+        """Initialize ResponseCacheManager.
+
+        Args:
+            config (CacheConfig): Cache configuration.
+            serializer (Any | None): Serializer instance.
+        """
+        super().__init__(
+            config=config,
+            serializer=serializer,
+        )
+        self.ttl = self.ttl or self.DEFAULT_TTL
+        self.hits = 0
+        self.misses = 0
+
+    def get_response(self, key: str) -> str | None:
+        """Retrieve cached LLM response and update hit/miss counters.
+
+        Args:
+            key (str): Response cache key.
+
+        Returns:
+            str | None: Cached response content.
+        """
+        response = super().get(key=key)
+        if response is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return response
+
+    def set_response(self, key: str, response: str) -> Any:
+        """Cache LLM response.
+
+        Args:
+            key (str): Response cache key.
+            response (str): Response content to cache.
+
+        Returns:
+            Any: Result of cache set operation.
+        """
+        return super().set(key=key, value=response)
+
+    @property
+    def tool_trace_namespace(self) -> str:
+        """Namespace for tool call traces, nested under the response namespace if set."""
+        if self.namespace:
+            return f"{self.namespace}:{self.TOOL_TRACE_NAMESPACE}"
+        return self.TOOL_TRACE_NAMESPACE
+
+    def get_tool_trace(self, prompt_key: str, step: int) -> dict | None:
+        """Retrieve the tool call recorded at a step of a cached agent run.
+
+        Args:
+            prompt_key (str): Response cache key of the initial agent prompt.
+            step (int): Agent loop number.
+
+        Returns:
+            dict | None: Tool name, input and output of the recorded call.
+        """
+        return super().get(key=self.get_key(prompt_key=prompt_key, step=step), namespace=self.tool_trace_namespace)
+
+    def set_tool_trace(self, prompt_key: str, step: int, tool_name: str, tool_input: Any, tool_output: Any) -> Any:
+        """Record the tool call made at a step of an agent run.
+
+        Args:
+            prompt_key (str): Response cache key of the initial agent prompt.
+            step (int): Agent loop number.
+            tool_name (str): Name of the called tool.
+            tool_input (Any): Tool input.
+            tool_output (Any): Tool output.
+
+        Returns:
+            Any: Result of cache set operation.
+        """
+        return super().set(
+            key=self.get_key(prompt_key=prompt_key, step=step),
+            value={"tool_name": tool_name, "tool_input": tool_input, "tool_output": tool_output},
+            namespace=self.tool_trace_namespace,
+        )
+
+    @staticmethod
+    def get_key(**params: Any) -> str:
+        """Generate cache key from canonical representation of request parameters.
+
+        Args:
+            params (Any): Parameters that define the LLM request, e.g. model, temperature and prompt text.
+
+        Returns:
+            str: SHA-256 hash of the parameters.
+        """
+        canonical = json.dumps(params, sort_keys=True, default=str)
+        return hashlib.sha256(canonical.encode()).hexdigest()
@@ -0,0 +1,121 @@
+import threading
+from collections import deque
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from dynamiq.components.embedders.base import BaseEmbedder
+
+
+class SemanticCache:
+    """In-process cache of LLM responses looked up by prompt similarity.
+
+    Prompts are embedded with the given embedder and L2-normalized, so a single matrix-vector
+    product gives cosine similarities against all cached prompts of the same scope. The closest
+    cached prompt is a hit if its similarity reaches the threshold. Prompts never match across
+    scopes, e.g. responses of different models. Entries are evicted oldest first.
+
+    Attributes:
+        embedder (BaseEmbedder): Text embedder for prompts.
+        similarity_threshold (float): Minimal cosine similarity for a cache hit.
+        max_size (int): Maximum number of entries across all scopes.
+        hits (int): Number of cache hits.
+        misses (int): Number of cache misses.
+    """
+
+    def __init__(self, embedder: "BaseEmbedder", similarity_threshold: float = 0.93, max_size: int = 1024):
+        """Initialize SemanticCache.
+
+        Args:
+            embedder (BaseEmbedder): Text embedder for prompts.
+            similarity_threshold (float): Minimal cosine similarity for a cache hit.
+            max_size (int): Maximum number of entries across all scopes.
+        """
+        # Import in runtime to save memory when semantic cache is not used
+        import numpy as np
+
+        self._np = np
+        self.embedder = embedder
+        self.similarity_threshold = similarity_threshold
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._scopes: dict[str, tuple[Any, list[str]]] = {}
+        self._entry_scopes: deque[str] = deque()
+        self._last_embedding: tuple[str, Any] | None = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entry_scopes)
+
+    def _embed(self, prompt: str) -> Any:
+        """Embed and normalize the prompt, reusing the embedding of the last looked up prompt.
+
+        Args:
+            prompt (str): Prompt text.
+
+        Returns:
+            numpy.ndarray: Normalized prompt embedding.
+        """
+        if self._last_embedding is not None and self._last_embedding[0] == prompt:
+            return self._last_embedding[1]
+
+        embedding = self._np.asarray(self.embedder.embed_text(prompt)["embedding"], dtype=self._np.float32)
+        if norm := self._np.linalg.norm(embedding):
+            embedding = embedding / norm
+        self._last_embedding = (prompt, embedding)
+        return embedding
+
+    def get(self, prompt: str, scope: str = "") -> str | None:
+        """Retrieve the response cached for the most similar prompt of the scope.
+
+        Args:
+            prompt (str): Prompt text.
+            scope (str): Scope of the prompt, e.g. a key of LLM parameters.
+
+        Returns:
+            str | None: Cached response or None if no cached prompt is similar enough.
+        """
+        embedding = self._embed(prompt)
+        with self._lock:
+            if (entries := self._scopes.get(scope)) is not None:
+                embeddings, responses = entries
+                similarities = embeddings @ embedding
+                idx = int(similarities.argmax())
+                if similarities[idx] >= self.similarity_threshold:
+                    self.hits += 1
+                    return responses[idx]
+
+            self.misses += 1
+            return None
+
+    def set(self, prompt: str, response: str, scope: str = "") -> None:
+        """Cache the response for the prompt.
+
+        Args:
+            prompt (str): Prompt text.
+            response (str): LLM response.
+            scope (str): Scope of the prompt, e.g. a key of LLM parameters.
+        """
+        embedding = self._embed(prompt)
+        with self._lock:
+            if len(self._entry_scopes) >= self.max_size:
+                oldest_scope = self._entry_scopes.popleft()
+                embeddings, responses = self._scopes[oldest_scope]
+                if len(responses) > 1:
+                    self._scopes[oldest_scope] = (embeddings[1:], responses[1:])
+                else:
+                    del self._scopes[oldest_scope]
+
+            if (entries := self._scopes.get(scope)) is not None:
+                embeddings, responses = entries
+                self._scopes[scope] = (self._np.vstack((embeddings, embedding)), responses + [response])
+            else:
+                self._scopes[scope] = (embedding[None, :], [response])
+            self._entry_scopes.append(scope)
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        with self._lock:
+            self._scopes = {}
+            self._entry_scopes = deque()
+            self._last_embedding = None
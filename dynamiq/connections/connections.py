@@ -1,4 +1,6 @@
 import enum
+import os
+import threading
 from abc import ABC, abstractmethod
 from functools import partial
 from typing import TYPE_CHECKING, Any, Literal
@@ -12,12 +14,72 @@ from dynamiq.utils.logger import logger
 
 if TYPE_CHECKING:
     from chromadb import ClientAPI as ChromaClient
+    from httpx import Client as HttpxClient
     from openai import OpenAI as OpenAIClient
     from pinecone import Pinecone as PineconeClient
     from qdrant_client import QdrantClient
     from weaviate import WeaviateClient
 
 
+SHARED_HTTP_CLIENT_TIMEOUT = {"timeout": 600, "connect": 5.0}
+
+_shared_http_client: "HttpxClient | None" = None
+_shared_http_client_lock = threading.Lock()
+
+
+def get_shared_http_client_limits() -> dict[str, int]:
+    """
+    Returns connection pool limits of the shared HTTP client.
+
+    Defaults match the OpenAI SDK client and can be changed with the `DYNAMIQ_HTTP_MAX_CONNECTIONS`
+    and `DYNAMIQ_HTTP_MAX_KEEPALIVE_CONNECTIONS` environment variables.
+
+    Returns:
+        dict[str, int]: Keyword arguments for `httpx.Limits`.
+    """
+    return {
+        "max_connections": int(os.environ.get("DYNAMIQ_HTTP_MAX_CONNECTIONS", 1000)),
+        "max_keepalive_connections": int(os.environ.get("DYNAMIQ_HTTP_MAX_KEEPALIVE_CONNECTIONS", 100)),
+    }
+
+
+def get_shared_http_client() -> "HttpxClient":
+    """
+    Returns the process-wide HTTP client shared by SDK clients of API connections.
+
+    Reusing one keep-alive connection pool lets nodes with separate connections avoid
+    repeated TCP and TLS handshakes to the same provider. SDK clients can not close the shared
+    client, as closing one connection client must not break the others. A new client is built
+    if the shared one was closed explicitly.
+
+    Returns:
+        HttpxClient: Shared HTTP client.
+    """
+    global _shared_http_client
+
+    with _shared_http_client_lock:
+        if _shared_http_client is None or _shared_http_client.is_closed:
+            # Import in runtime to save memory
+            import httpx
+
+            class SharedHttpxClient(httpx.Client):
+                """HTTP client that ignores close calls from the SDK clients sharing it."""
+
+                def close(self) -> None:
+                    pass
+
+                def force_close(self) -> None:
+                    """Closes the client and its connection pool."""
+                    super().close()
+
+            _shared_http_client = SharedHttpxClient(
+                limits=httpx.Limits(**get_shared_http_client_limits()),
+                timeout=httpx.Timeout(**SHARED_HTTP_CLIENT_TIMEOUT),
+                follow_redirects=True,
+            )
+        return _shared_http_client
+
+
 class ConnectionType(str, enum.Enum):
     """
     This enum defines various connection types for different services and databases.
@@ -251,7 +313,7 @@ class OpenAI(BaseApiKeyConnection):
         """
         # Import in runtime to save memory
         from openai import OpenAI as OpenAIClient
-        openai_client = OpenAIClient(api_key=self.api_key)
+        openai_client = OpenAIClient(api_key=self.api_key, http_client=get_shared_http_client())
         logger.debug("Connected to OpenAI")
         return openai_client
 
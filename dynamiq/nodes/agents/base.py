@@ -1,13 +1,20 @@
+import hashlib
 import io
-import json
 import re
-import textwrap
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Callable, ClassVar
+from functools import cached_property, lru_cache
+from itertools import islice, takewhile
+from string import Formatter
+from typing import Any, Callable, ClassVar, Mapping
 
 from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, TypeAdapter, ValidationError
 
+from dynamiq.cache.config import CacheConfig
+from dynamiq.cache.managers import ResponseCacheManager
+from dynamiq.cache.semantic import SemanticCache
 from dynamiq.connections.managers import ConnectionManager
 from dynamiq.memory import Memory
 from dynamiq.nodes import ErrorHandling, Node, NodeGroup
@@ -21,8 +28,64 @@ from dynamiq.nodes.node import NodeDependency, ensure_config
 from dynamiq.prompts import Message, MessageRole, Prompt
 from dynamiq.runnables import RunnableConfig, RunnableStatus
 from dynamiq.types.streaming import StreamingMode
+from dynamiq.utils import json_parser
 from dynamiq.utils.logger import logger
 
+ACTION_PATTERN = re.compile(r"Action:\s*(.*?)\nAction Input:\s*", re.DOTALL)
+FINAL_ANSWER_PATTERN = re.compile(r"Answer:\s*(.*)", re.DOTALL)
+TOOL_NAME_SANITIZE_PATTERN = re.compile(r"[^a-zA-Z0-9_-]")
+PLAN_CACHE_KEYWORD_PATTERN = re.compile(r"[a-z0-9]+")
+PLAN_CACHE_ADAPTER_PROMPT = (
+    "Adapt the plan written for the previous task to the new task. Keep the structure of the plan, "
+    "update every task-specific detail (names, numbers, places, dates and their order) to match the new task "
+    "and return only the adapted plan.\n\n"
+    "PREVIOUS TASK:\n{cached_task}\n\nPLAN:\n{cached_plan}\n\nNEW TASK:\n{task}"
+)
+PLAN_CACHE_STOPWORDS = frozenset(
+    (
+        "about after also been before being could does each from have into just like make more most much only "
+        "other over please should some such than that their them then there these they this those very want were "
+        "what when where which while will with would your"
+    ).split()
+)
+
+
+@lru_cache(maxsize=256)
+def _parse_prompt_template(template: str) -> tuple[tuple[str, str | None], ...] | None:
+    """
+    Parses a prompt block template once into pairs of literal text and variable name.
+
+    Args:
+        template (str): Prompt block template in str.format syntax.
+
+    Returns:
+        tuple[tuple[str, str | None], ...] | None: Parsed template parts, or None if the template uses
+            format specs, conversions or compound field names and has to be rendered with str.format_map.
+    """
+    parts = []
+    for literal, field_name, format_spec, conversion in Formatter().parse(template):
+        if field_name is not None and (format_spec or conversion or not field_name.isidentifier()):
+            return None
+        parts.append((literal, field_name))
+    return tuple(parts)
+
+
+def _render_prompt_template(template: str, variables: Mapping[str, Any]) -> str:
+    """
+    Renders a prompt block template with the given variables.
+
+    Args:
+        template (str): Prompt block template in str.format syntax.
+        variables (Mapping[str, Any]): Template variables.
+
+    Returns:
+        str: Rendered template.
+    """
+    parts = _parse_prompt_template(template)
+    if parts is None:
+        return template.format_map(variables)
+    return "".join([literal + str(variables[name]) if name is not None else literal for literal, name in parts])
+
 
 class StreamChunkChoiceDelta(BaseModel):
     """Delta model for content chunks."""
@@ -52,8 +115,8 @@ class AgentStatus(Enum):
 
 class AgentIntermediateStepModelObservation(BaseModel):
     initial: str | dict | None = None
-    tool_using: str | dict | None = None
-    tool_input: str | dict | None = None
+    tool_using: str | dict | list | None = None
+    tool_input: str | dict | list | None = None
     tool_output: Any = None
     updated: str | dict | None = None
 
@@ -64,14 +127,84 @@ class AgentIntermediateStep(BaseModel):
     final_answer: str | dict | None = None
 
 
+@dataclass
+class AgentIntermediateSteps:
+    """Columnar storage of agent intermediate steps with one entry per loop in each list."""
+
+    loop_nums: list[int] = field(default_factory=list)
+    input_data: list[str | dict] = field(default_factory=list)
+    initial: list[str | dict | None] = field(default_factory=list)
+    tool_using: list[str | dict | None] = field(default_factory=list)
+    tool_input: list[str | dict | None] = field(default_factory=list)
+    tool_output: list[Any] = field(default_factory=list)
+    updated: list[str | dict | None] = field(default_factory=list)
+    final_answer: list[str | dict | None] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.loop_nums)
+
+    def _index(self, loop_num: int) -> int:
+        if self.loop_nums and self.loop_nums[-1] == loop_num:
+            return len(self.loop_nums) - 1
+        return self.loop_nums.index(loop_num)
+
+    def add(self, loop_num: int, input_data: str | dict, initial: str | dict | None = None) -> None:
+        """Adds a step for the loop with the model input and initial model output."""
+        self.loop_nums.append(loop_num)
+        self.input_data.append(input_data)
+        self.initial.append(initial)
+        self.tool_using.append(None)
+        self.tool_input.append(None)
+        self.tool_output.append(None)
+        self.updated.append(None)
+        self.final_answer.append(None)
+
+    def update_observation(
+        self,
+        loop_num: int,
+        tool_using: str | dict | list | None,
+        tool_input: str | dict | list | None,
+        tool_output: Any,
+        updated: str | dict | None,
+    ) -> None:
+        """Records the tool call made in the loop and the updated model output."""
+        idx = self._index(loop_num)
+        self.tool_using[idx] = tool_using
+        self.tool_input[idx] = tool_input
+        self.tool_output[idx] = tool_output
+        self.updated[idx] = updated
+
+    def set_final_answer(self, loop_num: int, final_answer: str | dict | None) -> None:
+        """Records the final answer produced in the loop."""
+        self.final_answer[self._index(loop_num)] = final_answer
+
+    def as_legacy_dict(self) -> dict[int, dict]:
+        """Returns steps keyed by loop number in the AgentIntermediateStep dump format."""
+        return {
+            loop_num: {
+                "input_data": self.input_data[idx],
+                "model_observation": {
+                    "initial": self.initial[idx],
+                    "tool_using": self.tool_using[idx],
+                    "tool_input": self.tool_input[idx],
+                    "tool_output": self.tool_output[idx],
+                    "updated": self.updated[idx],
+                },
+                "final_answer": self.final_answer[idx],
+            }
+            for idx, loop_num in enumerate(self.loop_nums)
+        }
+
+
 class Agent(Node):
     """Base class for an AI Agent that interacts with a Language Model and tools."""
 
+    TOOL_CALL_CACHE_MAX_SIZE: ClassVar[int] = 128
+    TOOL_CALLS_MAX_WORKERS: ClassVar[int] = 8
     DEFAULT_INTRODUCTION: ClassVar[str] = (
         "You are a helpful AI assistant designed to assist users with various tasks and queries."
         "Your goal is to provide accurate, helpful, and friendly responses to the best of your abilities."
     )
-    DEFAULT_DATE: ClassVar[str] = datetime.now().strftime("%d %B %Y")
 
     llm: Node = Field(..., description="LLM used by the agent.")
     group: NodeGroup = NodeGroup.AGENTS
@@ -83,21 +216,47 @@ class Agent(Node):
     max_loops: int = 1
     memory: Memory | None = Field(None, description="Memory node for the agent.")
     memory_retrieval_strategy: str = "all"  # all, relevant, both
+    response_cache: CacheConfig | None = Field(
+        None, description="Cache configuration for deterministic LLM responses. Disabled if not set."
+    )
+    semantic_cache: SemanticCache | None = Field(
+        None, description="Cache for deterministic LLM responses to similar prompts. Disabled if not set."
+    )
 
     _prompt_blocks: dict[str, str] = PrivateAttr(default_factory=dict)
     _prompt_variables: dict[str, Any] = PrivateAttr(default_factory=dict)
+    _response_cache_manager: ResponseCacheManager | None = PrivateAttr(default=None)
+    _static_prompt_prefix: tuple[tuple[tuple[str, str], ...], str] | None = PrivateAttr(default=None)
+    _prompt_date: str = PrivateAttr(default="")
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self._intermediate_steps: dict[int, dict] = {}
+        self._intermediate_steps = AgentIntermediateSteps()
         self._run_depends: list[dict] = []
+        self._tool_call_cache: dict[tuple[str, bytes], Any] = {}
         self._init_prompt_blocks()
 
     @property
     def to_dict_exclude_params(self):
-        return super().to_dict_exclude_params | {"llm": True, "tools": True, "memory": True, "files": True}
+        return super().to_dict_exclude_params | {
+            "llm": True,
+            "tools": True,
+            "memory": True,
+            "files": True,
+            "response_cache": {"password": True},
+            "semantic_cache": True,
+        }
+
+    @property
+    def response_cache_manager(self) -> ResponseCacheManager | None:
+        """Returns the LLM response cache manager, initialized on first access."""
+        if self.response_cache is None:
+            return None
+        if self._response_cache_manager is None:
+            self._response_cache_manager = ResponseCacheManager(config=self.response_cache)
+        return self._response_cache_manager
 
     def to_dict(self, **kwargs) -> dict:
         """Converts the instance to a dictionary."""
@@ -118,19 +277,27 @@ class Agent(Node):
             if tool.is_postponed_component_init:
                 tool.init_components(connection_manager)
             tool.is_optimized_for_agents = True
+        # Tools can update their names or descriptions during initialization
+        self.reset_tools_cache()
+
+    def __setattr__(self, name: str, value: Any):
+        super().__setattr__(name, value)
+        if name == "tools":
+            self.reset_tools_cache()
 
     def sanitize_tool_name(self, s: str):
         """Sanitize tool name to follow [^a-zA-Z0-9_-]."""
         s = s.replace(" ", "-")
-        sanitized = re.sub(r"[^a-zA-Z0-9_-]", "", s)
+        sanitized = TOOL_NAME_SANITIZE_PATTERN.sub("", s)
         return sanitized
 
     def _init_prompt_blocks(self):
         """Initializes default prompt blocks and variables."""
+        self._prompt_date = self._get_current_date()
         self._prompt_blocks = {
             "introduction": self.DEFAULT_INTRODUCTION,
             "role": self.role or "",
-            "date": self.DEFAULT_DATE,
+            "date": self._prompt_date,
             "tools": "{tool_description}",
             "files": "{file_description}",
             "instructions": "",
@@ -207,7 +374,7 @@ class Agent(Node):
 
         execution_result = {
             "content": result,
-            "intermediate_steps": self._intermediate_steps,
+            "intermediate_steps": self._intermediate_steps.as_legacy_dict(),
         }
 
         logger.debug(f"Agent {self.name} - {self.id}: finished with result {result}")
@@ -234,14 +401,79 @@ class Agent(Node):
             self._prompt_variables["relevant_memory"] = relevant_memory
             self._prompt_variables["context"] = context
 
+    @property
+    def is_llm_deterministic(self) -> bool:
+        """Checks if the LLM has zero temperature or a fixed seed."""
+        return getattr(self.llm, "temperature", None) == 0 or getattr(self.llm, "seed", None) is not None
+
+    def _get_response_cache_key(self, prompt: str, **params: Any) -> str | None:
+        """Returns the response cache key for the prompt or None if the response must not be cached.
+
+        Only deterministic LLM configurations (zero temperature or fixed seed) are cached,
+        otherwise a cache hit would silently replace sampling with a replay.
+        Additional params that change the LLM request (e.g. inference mode) are included in the key
+        and take precedence over the LLM ones.
+        """
+        if self.response_cache is None or not self.is_llm_deterministic:
+            return None
+
+        return ResponseCacheManager.get_key(**(self._get_llm_cache_params() | params), prompt=prompt)
+
+    def _get_llm_cache_params(self) -> dict[str, Any]:
+        """Returns the LLM parameters that scope cached responses.
+
+        These are all completion params (e.g. max tokens and stop sequences) together with
+        the inference mode and schema the response format is built from.
+        """
+        llm_params = getattr(self.llm, "completion_params", None) or {
+            name: getattr(self.llm, name, None) for name in ("model", "temperature", "top_p", "seed")
+        }
+        schema = getattr(self.llm, "schema_", None)
+        if isinstance(schema, type) and issubclass(schema, BaseModel):
+            schema = schema.model_json_schema()
+        return llm_params | {
+            "inference_mode": getattr(self.llm, "inference_mode", None),
+            "schema": schema,
+            "tools": self.tool_names,
+        }
+
+    def _get_semantic_cache_query(self, prompt: str) -> tuple[str, str]:
+        """Splits the prompt into the semantic cache scope and the user input to embed.
+
+        The rest of the prompt (instructions, context, history) is part of the scope together with
+        LLM parameters, so only prompts that differ in user input alone can match. If the user input
+        can not be located in the prompt, the whole prompt is the scope and only identical prompts match.
+        """
+        user_input = self._prompt_variables.get("input")
+        dynamic_prompt = self._normalize_prompt(user_input) if isinstance(user_input, str) else ""
+        if dynamic_prompt and prompt.count(dynamic_prompt) == 1:
+            static_prompt = prompt.replace(dynamic_prompt, "{input}")
+        else:
+            static_prompt = dynamic_prompt = prompt
+
+        scope = ResponseCacheManager.get_key(**self._get_llm_cache_params(), prompt=static_prompt)
+        return scope, dynamic_prompt
+
     def _run_llm(self, prompt: str, config: RunnableConfig | None = None, **kwargs) -> str:
         """Runs the LLM with a given prompt and handles streaming or full responses."""
         logger.debug(f"Agent {self.name} - {self.id}: Running LLM with prompt:\n{prompt}")
+        cache_key = self._get_response_cache_key(prompt)
+        if cache_key and (cached_response := self.response_cache_manager.get_response(cache_key)) is not None:
+            logger.debug(f"Agent {self.name} - {self.id}: LLM result loaded from cache")
+            return cached_response
+
+        semantic_cache = self.semantic_cache if self.is_llm_deterministic else None
+        if semantic_cache is not None:
+            semantic_scope, semantic_prompt = self._get_semantic_cache_query(prompt)
+            if (cached_response := semantic_cache.get(semantic_prompt, scope=semantic_scope)) is not None:
+                logger.debug(f"Agent {self.name} - {self.id}: LLM result loaded from semantic cache")
+                return cached_response
+
         try:
             llm_result = self.llm.run(
                 input_data={},
                 config=config,
-                prompt=Prompt(messages=[Message(role="user", content=prompt)]),
+                prompt=Prompt.model_construct(messages=self._get_prompt_messages(prompt)),
                 run_depends=self._run_depends,
                 **kwargs,
             )
@@ -250,7 +482,12 @@ class Agent(Node):
             if llm_result.status != RunnableStatus.SUCCESS:
                 raise ValueError("LLM execution failed")
 
-            return llm_result.output["content"]
+            content = llm_result.output["content"]
+            if cache_key:
+                self.response_cache_manager.set_response(cache_key, content)
+            if semantic_cache is not None:
+                semantic_cache.set(semantic_prompt, content, scope=semantic_scope)
+            return content
 
         except Exception as e:
             logger.error(f"Agent {self.name} - {self.id}: LLM execution failed: {str(e)}")
@@ -317,18 +554,10 @@ class Agent(Node):
     def _parse_action(self, output: str) -> tuple[str | None, str | None]:
         """Parses the action and its input from the output string."""
         try:
-            action_match = re.search(
-                r"Action:\s*(.*?)\nAction Input:\s*(({\n)?.*?)(?:[^}]*$)",
-                output,
-                re.DOTALL,
-            )
+            action_match = ACTION_PATTERN.search(output)
             if action_match:
                 action = action_match.group(1).strip()
-                action_input = action_match.group(2).strip()
-                if "```json" in action_input:
-                    action_input = action_input.replace("```json", "").replace("```", "").strip()
-
-                action_input = json.loads(action_input)
+                action_input = json_parser.loads(self._extract_action_input(output[action_match.end() :]))
                 return action, action_input
             else:
                 raise ActionParsingException()
@@ -344,9 +573,51 @@ class Agent(Node):
                 recoverable=True,
             )
 
+    @staticmethod
+    def _extract_action_input(text: str) -> str:
+        """
+        Extracts the action input object that follows the "Action Input:" marker.
+
+        The first JSON object is matched by counting braces outside of string literals in a single pass.
+        If the braces never balance, the input spans up to the last closing brace instead.
+
+        Args:
+            text (str): Output text that follows the "Action Input:" marker.
+
+        Returns:
+            str: The action input string.
+        """
+        start = text.find("{")
+        if start != -1:
+            depth = 0
+            in_string = False
+            escaped = False
+            for idx in range(start, len(text)):
+                char = text[idx]
+                if in_string:
+                    if escaped:
+                        escaped = False
+                    elif char == "\\":
+                        escaped = True
+                    elif char == '"':
+                        in_string = False
+                elif char == '"':
+                    in_string = True
+                elif char == "{":
+                    depth += 1
+                elif char == "}":
+                    depth -= 1
+                    if depth == 0:
+                        return text[start : idx + 1]
+
+        action_input = text[: text.rfind("}") + 1].strip()
+        if "```json" in action_input:
+            action_input = action_input.replace("```json", "").replace("```", "").strip()
+        return action_input
+
     def _extract_final_answer(self, output: str) -> str:
         """Extracts the final answer from the output string."""
-        match = re.search(r"Answer:\s*(.*)", output, re.DOTALL)
+        match = FINAL_ANSWER_PATTERN.search(output)
         return match.group(1).strip() if match else ""
 
     def _get_tool(self, action: str) -> Node:
@@ -361,29 +632,128 @@ class Agent(Node):
             )
         return tool
 
-    def _run_tool(self, tool: Node, tool_input: str, config, **kwargs) -> Any:
-        """Runs a specific tool with the given input."""
+    def _run_tool(
+        self, tool: Node, tool_input: str, config, run_depends: list[dict] | None = None, **kwargs
+    ) -> Any:
+        """Runs a specific tool with the given input.
+
+        Results of idempotent tools are reused for the same call made earlier in the run.
+        If run_depends is given, the caller tracks run dependencies and the agent ones are left as is.
+        """
         logger.debug(f"Agent {self.name} - {self.id}: Running tool '{tool.name}'")
+        cache_key = None
+        if tool.is_idempotent:
+            cache_key = (tool.id, hashlib.blake2b(json_parser.dumps_sorted(tool_input)).digest())
+        if cache_key in self._tool_call_cache:
+            logger.debug(f"Agent {self.name} - {self.id}: Tool '{tool.name}' result reused from the current run")
+            if run_depends is None:
+                self._run_depends = [NodeDependency(node=tool).to_dict()]
+            return self._tool_call_cache[cache_key]
+
         if self.files:
             if tool.is_files_allowed is True:
-                tool_input["files"] = self.files
+                tool_input = {**tool_input, "files": self.files}
 
         tool_result = tool.run(
             input_data=tool_input,
             config=config,
-            run_depends=self._run_depends,
+            run_depends=self._run_depends if run_depends is None else run_depends,
             **kwargs,
         )
-        self._run_depends = [NodeDependency(node=tool).to_dict()]
+        if run_depends is None:
+            self._run_depends = [NodeDependency(node=tool).to_dict()]
         if tool_result.status != RunnableStatus.SUCCESS:
             logger.error({tool_result.output["content"]})
             if tool_result.output["recoverable"]:
                 raise ToolExecutionException({tool_result.output["content"]})
             else:
                 raise ValueError({tool_result.output["content"]})
+
+        if cache_key is not None:
+            if len(self._tool_call_cache) >= self.TOOL_CALL_CACHE_MAX_SIZE:
+                self._tool_call_cache.pop(next(iter(self._tool_call_cache)), None)
+            self._tool_call_cache[cache_key] = tool_result.output["content"]
         return tool_result.output["content"]
 
-    @property
+    def _run_tool_with_trace(
+        self, tool: Node, tool_input: dict, config, prompt_key: str | None, step: int, **kwargs
+    ) -> Any:
+        """
+        Runs a tool, reusing the output recorded for the same tool call at this step of a cached run.
+
+        Only outputs of idempotent tools are recorded and replayed.
+
+        Args:
+            tool (Node): Tool to run.
+            tool_input (dict): Tool input.
+            config: Configuration for the run.
+            prompt_key (str | None): Response cache key of the initial prompt. Traces are not used if None.
+            step (int): Agent loop number.
+            **kwargs: Additional keyword arguments passed to the tool run.
+
+        Returns:
+            Any: Tool result.
+        """
+        if prompt_key is None or self.files or not tool.is_idempotent:
+            return self._run_tool(tool, tool_input, config, **kwargs)
+
+        trace = self.response_cache_manager.get_tool_trace(prompt_key, step)
+        if trace and trace["tool_name"] == tool.name and trace["tool_input"] == tool_input:
+            logger.debug(f"Agent {self.name} - {self.id}: Tool '{tool.name}' result loaded from cache")
+            return trace["tool_output"]
+
+        tool_result = self._run_tool(tool, tool_input, config, **kwargs)
+        try:
+            self.response_cache_manager.set_tool_trace(prompt_key, step, tool.name, tool_input, tool_result)
+        except Exception as e:
+            logger.warning(f"Agent {self.name} - {self.id}: Failed to cache tool '{tool.name}' result: {e}")
+        return tool_result
+
+    def _run_tools(self, tool_calls: list[tuple[Node, dict]], config, **kwargs) -> list[Any]:
+        """
+        Runs independent tool calls concurrently.
+
+        Calls of the same tool instance run one after another, as nodes keep per-run state.
+        At most TOOL_CALLS_MAX_WORKERS tools run at the same time.
+
+        Args:
+            tool_calls (list[tuple[Node, dict]]): Pairs of tool and tool input.
+            config: Configuration for the run.
+            **kwargs: Additional keyword arguments passed to each tool run.
+
+        Returns:
+            list[Any]: Tool results in the order of tool calls. Failed calls are returned as exceptions.
+        """
+        run_depends = self._run_depends
+
+        def run_tool_call(tool_call: tuple[Node, dict]) -> Any:
+            tool, tool_input = tool_call
+            try:
+                return self._run_tool(tool, tool_input, config, run_depends=run_depends, **kwargs)
+            except Exception as e:
+                return e
+
+        calls_by_tool: dict[int, list[int]] = {}
+        for idx, (tool, _) in enumerate(tool_calls):
+            calls_by_tool.setdefault(id(tool), []).append(idx)
+
+        results = [None] * len(tool_calls)
+
+        def run_tool_calls(indices: list[int]):
+            for idx in indices:
+                results[idx] = run_tool_call(tool_calls[idx])
+
+        if len(calls_by_tool) <= 1:
+            run_tool_calls(list(range(len(tool_calls))))
+        else:
+            with ThreadPoolExecutor(max_workers=min(len(calls_by_tool), self.TOOL_CALLS_MAX_WORKERS)) as executor:
+                list(executor.map(run_tool_calls, calls_by_tool.values()))
+
+        tools = {id(tool): tool for tool, _ in tool_calls}.values()
+        self._run_depends = [NodeDependency(node=tool).to_dict() for tool in tools] or run_depends
+        return results
+
+    @cached_property
     def tool_description(self) -> str:
         """Returns a description of the tools available to the agent."""
         return (
@@ -406,38 +776,92 @@ class Agent(Node):
             return file_description
         return ""
 
-    @property
+    @cached_property
     def tool_names(self) -> str:
         """Returns a comma-separated list of tool names available to the agent."""
         return ",".join([self.sanitize_tool_name(tool.name) for tool in self.tools])
 
-    @property
+    @cached_property
     def tool_by_names(self) -> dict[str, Node]:
         """Returns a dictionary mapping tool names to their corresponding Node objects."""
         return {self.sanitize_tool_name(tool.name): tool for tool in self.tools}
 
+    def reset_tools_cache(self):
+        """Resets cached tool properties and refreshes the tool description prompt variable from the current tools."""
+        for name in ("tool_by_names", "tool_description", "tool_names"):
+            self.__dict__.pop(name, None)
+        self._prompt_variables["tool_description"] = self.tool_description
+
+    def add_tool(self, tool: Node):
+        """Adds a tool to the agent and resets cached tool properties."""
+        self.tools.append(tool)
+        self.reset_tools_cache()
+
     def reset_run_state(self):
         """Resets the agent's run state."""
-        self._intermediate_steps = {}
+        self._intermediate_steps = AgentIntermediateSteps()
         self._run_depends = []
+        self._tool_call_cache = {}
+        self._refresh_prompt_date()
+
+    @staticmethod
+    def _get_current_date() -> str:
+        """Returns the current UTC date in ISO 8601 format."""
+        return datetime.now(timezone.utc).date().isoformat()
+
+    def _refresh_prompt_date(self):
+        """Updates the default date block to the current date, keeping custom date blocks intact."""
+        current_date = self._get_current_date()
+        if current_date != self._prompt_date and self._prompt_blocks.get("date") == self._prompt_date:
+            self._prompt_blocks["date"] = current_date
+        self._prompt_date = current_date
+
+    @staticmethod
+    def _normalize_prompt(prompt: str) -> str:
+        """Strips lines, drops empty ones and collapses inner whitespace in a single pass over the lines."""
+        return "\n".join(" ".join(words) for line in prompt.splitlines() if (words := line.split()))
+
+    def _get_static_prompt_prefix(self) -> tuple[int, str]:
+        """Returns the number of leading prompt blocks without template variables and their rendered text.
+
+        The rendered prefix is cached and rebuilt only when these blocks change, so steps of a run
+        format just the dynamic blocks and the prompt keeps a stable prefix for provider-side caching.
+        """
+        static_blocks = tuple(takewhile(lambda item: "{" not in item[1], self._prompt_blocks.items()))
+        if self._static_prompt_prefix is None or self._static_prompt_prefix[0] != static_blocks:
+            prefix = "".join(f"{block.upper()}:\n{content}\n\n" for block, content in static_blocks if content)
+            self._static_prompt_prefix = (static_blocks, self._normalize_prompt(prefix))
+        return len(static_blocks), self._static_prompt_prefix[1]
+
+    def _get_prompt_messages(self, prompt: str) -> list[Message]:
+        """Splits the prompt into a system message with the static prompt prefix and a user message with the rest.
+
+        The prefix is sent as its own message, so providers with explicit prompt caching can mark it as cacheable.
+        """
+        static_prefix = self._static_prompt_prefix[1] if self._static_prompt_prefix else ""
+        if static_prefix and len(prompt) > len(static_prefix) and prompt.startswith(static_prefix):
+            return [
+                Message.model_construct(role=MessageRole.SYSTEM, content=static_prefix),
+                Message.model_construct(role=MessageRole.USER, content=prompt[len(static_prefix):].lstrip("\n")),
+            ]
+        return [Message.model_construct(role=MessageRole.USER, content=prompt)]
 
     def generate_prompt(self, block_names: list[str] | None = None, **kwargs) -> str:
         """Generates the prompt using specified blocks and variables."""
-        temp_variables = self._prompt_variables.copy()
-        temp_variables.update(kwargs)
+        temp_variables = self._prompt_variables | kwargs if kwargs else self._prompt_variables
+
+        static_blocks_count, static_prefix = self._get_static_prompt_prefix() if block_names is None else (0, "")
         prompt = ""
-        for block, content in self._prompt_blocks.items():
+        for block, content in islice(self._prompt_blocks.items(), static_blocks_count, None):
             if block_names is None or block in block_names:
                 if content:
-                    formatted_content = content.format(**temp_variables)
+                    formatted_content = _render_prompt_template(content, temp_variables)
                     prompt += f"{block.upper()}:\n{formatted_content}\n\n"
 
-        prompt = textwrap.dedent(prompt)
-        lines = prompt.splitlines()
-        stripped_lines = [line.strip() for line in lines if line.strip()]
-        prompt = "\n".join(stripped_lines)
-        prompt = "\n".join(" ".join(line.split()) for line in prompt.split("\n"))
-        return prompt
+        prompt = self._normalize_prompt(prompt)
+        if static_prefix and prompt:
+            return f"{static_prefix}\n{prompt}"
+        return static_prefix or prompt
 
 
 class AgentManager(Agent):
@@ -445,11 +869,60 @@ class AgentManager(Agent):
 
     _actions: dict[str, Callable] = PrivateAttr(default_factory=dict)
     name: str = "Manager Agent"
+    plan_cache: CacheConfig | None = Field(
+        None, description="Cache configuration for plans reused across similar tasks. Disabled if not set."
+    )
+    plan_cache_similarity_threshold: float | None = Field(
+        None,
+        ge=0,
+        le=1,
+        description=(
+            "Minimal Jaccard similarity of task keywords to adapt a plan cached for a similar task. "
+            "Only plans of identical tasks are reused if not set."
+        ),
+    )
+    plan_cache_adapter_llm: Node | None = Field(
+        None, description="LLM adapting plans cached for similar tasks. Defaults to the manager LLM."
+    )
+    semantic_cache: None = Field(
+        None, description="Not supported, plans and answers differ for similar tasks with different details."
+    )
+
+    PLAN_CACHE_INDEX_NAMESPACE: ClassVar[str] = "plan_index"
+    PLAN_CACHE_INDEX_MAX_SIZE: ClassVar[int] = 256
+
+    _plan_cache_manager: ResponseCacheManager | None = PrivateAttr(default=None)
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._init_actions()
 
+    @property
+    def to_dict_exclude_params(self):
+        return super().to_dict_exclude_params | {"plan_cache": {"password": True}, "plan_cache_adapter_llm": True}
+
+    def init_components(self, connection_manager: ConnectionManager = ConnectionManager()):
+        """Initialize components for the manager and the plan cache adapter LLM."""
+        super().init_components(connection_manager)
+        if self.plan_cache_adapter_llm and self.plan_cache_adapter_llm.is_postponed_component_init:
+            self.plan_cache_adapter_llm.init_components(connection_manager)
+
+    @property
+    def plan_cache_manager(self) -> ResponseCacheManager | None:
+        """Returns the plan cache manager, initialized on first access."""
+        if self.plan_cache is None:
+            return None
+        if self._plan_cache_manager is None:
+            self._plan_cache_manager = ResponseCacheManager(config=self.plan_cache)
+        return self._plan_cache_manager
+
+    @property
+    def plan_cache_index_namespace(self) -> str:
+        """Namespace for task keyword indexes, nested under the plan cache namespace if set."""
+        if self.plan_cache_manager.namespace:
+            return f"{self.plan_cache_manager.namespace}:{self.PLAN_CACHE_INDEX_NAMESPACE}"
+        return self.PLAN_CACHE_INDEX_NAMESPACE
+
     def to_dict(self, **kwargs) -> dict:
         """Converts the instance to a dictionary."""
         data = super().to_dict(**kwargs)
@@ -489,12 +962,20 @@ class AgentManager(Agent):
         kwargs = kwargs | {"parent_run_id": kwargs.get("run_id")}
         kwargs.pop("run_depends", None)
 
-        _result_llm = self._actions[action](config=config, **kwargs)
+        plan_task = self._get_plan_task(input_data) if action == "plan" else None
+        _result_llm = self._get_cached_plan(input_data, plan_task) if plan_task else None
+        if _result_llm is None:
+            if plan_task:
+                _result_llm = self._get_similar_task_plan(input_data, plan_task, config, **kwargs)
+            if _result_llm is None:
+                _result_llm = self._actions[action](config=config, **kwargs)
+            if plan_task:
+                self._set_cached_plan(input_data, plan_task, _result_llm)
         result = {"action": action, "result": _result_llm}
 
         execution_result = {
             "content": result,
-            "intermediate_steps": self._intermediate_steps,
+            "intermediate_steps": self._intermediate_steps.as_legacy_dict(),
         }
 
         logger.debug(
@@ -502,6 +983,107 @@ class AgentManager(Agent):
         )
         return execution_result
 
+    def _get_plan_task(self, input_data: dict[str, Any]) -> str | None:
+        """Returns the planned task or None if the plan must not be cached.
+
+        Only plans built from a standalone task description are cached; plans that depend on
+        the conversation state (e.g. adaptive next-action planning over chat history) are not.
+        """
+        if self.plan_cache is None:
+            return None
+
+        task = input_data.get("input_task") or input_data.get("input")
+        if not isinstance(task, str) or not task.strip():
+            return None
+        return task
+
+    @staticmethod
+    def _get_plan_cache_key(agents: str, task: str) -> str:
+        """Generates the plan cache key from agents description and case and whitespace normalized task."""
+        return ResponseCacheManager.get_key(agents=agents, task=" ".join(task.lower().split()))
+
+    @staticmethod
+    def _get_plan_keywords(task: str) -> frozenset[str]:
+        """Extracts the keyword signature of the task used for similarity lookups."""
+        return frozenset(PLAN_CACHE_KEYWORD_PATTERN.findall(task.lower())) - PLAN_CACHE_STOPWORDS
+
+    def _get_cached_plan(self, input_data: dict[str, Any], task: str) -> str | None:
+        """Looks up a plan cached for the same agents and task."""
+        cache_key = self._get_plan_cache_key(str(input_data.get("agents", "")), task)
+        if (cached := self.plan_cache_manager.get_response(cache_key)) is not None:
+            logger.debug(f"AgentManager {self.name} - {self.id}: plan loaded from cache")
+            return cached["plan"]
+        return None
+
+    def _get_similar_task_plan(
+        self, input_data: dict[str, Any], task: str, config: RunnableConfig, **kwargs
+    ) -> str | None:
+        """Adapts the plan cached for the task with the most similar keywords if similarity lookups are enabled."""
+        if self.plan_cache_similarity_threshold is None or not (keywords := self._get_plan_keywords(task)):
+            return None
+
+        best_key, best_similarity = None, 0.0
+        for cached_keywords, cache_key in self._get_plan_index(str(input_data.get("agents", ""))):
+            cached_keywords = frozenset(cached_keywords)
+            similarity = len(keywords & cached_keywords) / len(keywords | cached_keywords)
+            if similarity > best_similarity:
+                best_key, best_similarity = cache_key, similarity
+
+        if best_key is None or best_similarity < self.plan_cache_similarity_threshold:
+            return None
+        if (cached := self.plan_cache_manager.get_response(best_key)) is None:
+            return None
+
+        logger.debug(
+            f"AgentManager {self.name} - {self.id}: adapting plan cached for similar task "
+            f"with keywords similarity {best_similarity:.2f}"
+        )
+        return self._adapt_cached_plan(cached["task"], cached["plan"], task, config, **kwargs)
+
+    def _get_plan_index(self, agents: str) -> list[list]:
+        """Returns the keyword index of tasks with plans cached for the agents as pairs of keywords and cache key."""
+        index = self.plan_cache_manager.get(
+            key=ResponseCacheManager.get_key(agents=agents), namespace=self.plan_cache_index_namespace
+        )
+        return index or []
+
+    def _adapt_cached_plan(
+        self, cached_task: str, cached_plan: str, task: str, config: RunnableConfig, **kwargs
+    ) -> str:
+        """Adapts the plan cached for a similar task to the current task with the adapter LLM."""
+        llm = self.plan_cache_adapter_llm or self.llm
+        prompt = PLAN_CACHE_ADAPTER_PROMPT.format(cached_task=cached_task, cached_plan=cached_plan, task=task)
+        llm_result = llm.run(
+            input_data={},
+            config=config,
+            prompt=Prompt.model_construct(messages=[Message.model_construct(role=MessageRole.USER, content=prompt)]),
+            run_depends=self._run_depends,
+            **kwargs,
+        )
+        self._run_depends = [NodeDependency(node=llm).to_dict()]
+        if llm_result.status != RunnableStatus.SUCCESS:
+            raise ValueError("Plan adaptation failed")
+        return llm_result.output["content"]
+
+    def _set_cached_plan(self, input_data: dict[str, Any], task: str, plan: str):
+        """Caches the plan and indexes its task keywords for similarity lookups.
+
+        The index is stored in the plan cache next to the plans, so it is shared across processes
+        and keeps the latest PLAN_CACHE_INDEX_MAX_SIZE tasks.
+        """
+        agents = str(input_data.get("agents", ""))
+        cache_key = self._get_plan_cache_key(agents, task)
+        self.plan_cache_manager.set_response(cache_key, {"task": task, "plan": plan})
+
+        if self.plan_cache_similarity_threshold is not None and (keywords := self._get_plan_keywords(task)):
+            index = [entry for entry in self._get_plan_index(agents) if entry[1] != cache_key]
+            index.append([sorted(keywords), cache_key])
+            self.plan_cache_manager.set(
+                key=ResponseCacheManager.get_key(agents=agents),
+                value=index[-self.PLAN_CACHE_INDEX_MAX_SIZE :],
+                namespace=self.plan_cache_index_namespace,
+            )
+
     def _plan(self, config: RunnableConfig, **kwargs) -> str:
         """Executes the 'plan' action."""
         prompt = self.generate_prompt(block_names=["plan"])
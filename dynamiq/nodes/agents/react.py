@@ -5,13 +5,14 @@ from typing import Any
 from litellm import get_supported_openai_params, supports_function_calling
 from pydantic import Field, model_validator
 
-from dynamiq.nodes.agents.base import Agent, AgentIntermediateStep, AgentIntermediateStepModelObservation
+from dynamiq.nodes.agents.base import Agent
 from dynamiq.nodes.agents.exceptions import ActionParsingException, MaxLoopsExceededException, RecoverableAgentException
 from dynamiq.nodes.node import Node, NodeDependency
 from dynamiq.nodes.types import Behavior, InferenceMode
-from dynamiq.prompts import Message, Prompt
+from dynamiq.prompts import Prompt
 from dynamiq.runnables import RunnableConfig, RunnableStatus
 from dynamiq.types.streaming import StreamingMode
+from dynamiq.utils import json_parser
 from dynamiq.utils.logger import logger
 
 REACT_BLOCK_TOOLS = (
@@ -253,7 +254,7 @@ class ReActAgent(Agent):
         action_input_text = self.parse_xml_content(output_content, "action_input")
 
         try:
-            action_input = json.loads(action_input_text)
+            action_input = json_parser.loads(action_input_text)
         except json.JSONDecodeError:
             raise ActionParsingException(
                 (
@@ -276,19 +277,14 @@ class ReActAgent(Agent):
         return {"output": output, "answer": answer}
 
     def tracing_final(self, loop_num, final_answer, config, kwargs):
-        self._intermediate_steps[loop_num]["final_answer"] = final_answer
+        self._intermediate_steps.set_final_answer(loop_num, final_answer)
 
     def tracing_intermediate(self, loop_num, formatted_prompt, llm_generated_output):
-        self._intermediate_steps[loop_num] = AgentIntermediateStep(
-            input_data={"prompt": formatted_prompt},
-            model_observation=AgentIntermediateStepModelObservation(
-                initial=llm_generated_output,
-            ),
-        ).model_dump()
+        self._intermediate_steps.add(loop_num, input_data={"prompt": formatted_prompt}, initial=llm_generated_output)
 
     def convert_string_to_dict(string: str) -> dict:
         string = re.sub(r'\\+', r'\\', string)
-        return json.loads(string)
+        return json_parser.loads(string)
 
     def _run_agent(self, config: RunnableConfig | None = None, **kwargs) -> str:
         """
@@ -305,6 +301,7 @@ class ReActAgent(Agent):
 
         logger.info(f"Agent {self.name} - {self.id}: Running ReAct strategy")
         previous_responses = []
+        prompt_key = None
 
         for loop_num in range(self.max_loops):
             formatted_prompt = self.generate_prompt(
@@ -314,36 +311,52 @@ class ReActAgent(Agent):
                 context="\n".join(previous_responses),
                 input_formats=self.generate_input_formats(self.tools)
             )
+            if loop_num == 0:
+                prompt_key = self._get_response_cache_key(formatted_prompt)
             logger.info(f"Agent {self.name} - {self.id}: Loop {loop_num + 1} started.")
 
             logger.debug(f"Agent {self.name} - {self.id}: Loop {loop_num + 1}. Prompt:\n{formatted_prompt}")
 
             try:
-
-                llm_result = self.llm.run(
-                    input_data={},
-                    config=config,
-                    prompt=Prompt(messages=[Message(role="user", content=formatted_prompt)]),
-                    run_depends=self._run_depends,
-                    schema=self.format_schema,
-                    inference_mode=self.inference_mode,
-                    **kwargs,
+                cache_key = self._get_response_cache_key(
+                    formatted_prompt, inference_mode=self.inference_mode, schema=self.format_schema
                 )
-                self._run_depends = [NodeDependency(node=self.llm).to_dict()]
-
-                if llm_result.status != RunnableStatus.SUCCESS:
-                    logger.error(
-                        f"Agent {self.name} - {self.id}: Loop {loop_num + 1} LLM execution failed. "
-                        f"Error output: {llm_result.output}"
+                llm_output = self.response_cache_manager.get_response(cache_key) if cache_key else None
+                if llm_output is not None:
+                    logger.debug(f"Agent {self.name} - {self.id}: Loop {loop_num + 1} LLM result loaded from cache")
+                else:
+                    llm_result = self.llm.run(
+                        input_data={},
+                        config=config,
+                        prompt=Prompt.model_construct(messages=self._get_prompt_messages(formatted_prompt)),
+                        run_depends=self._run_depends,
+                        schema=self.format_schema,
+                        inference_mode=self.inference_mode,
+                        **kwargs,
                     )
-                    previous_responses.append(llm_result.output["content"])
-                    continue
+                    self._run_depends = [NodeDependency(node=self.llm).to_dict()]
+
+                    if llm_result.status != RunnableStatus.SUCCESS:
+                        logger.error(
+                            f"Agent {self.name} - {self.id}: Loop {loop_num + 1} LLM execution failed. "
+                            f"Error output: {llm_result.output}"
+                        )
+                        previous_responses.append(llm_result.output["content"])
+                        continue
+
+                    llm_output = {
+                        "content": llm_result.output["content"],
+                        "tool_calls": llm_result.output.get("tool_calls"),
+                    }
+                    if cache_key:
+                        self.response_cache_manager.set_response(cache_key, llm_output)
 
                 action, action_input = None, None
+                tool_calls = []
                 llm_generated_output = ""
                 match self.inference_mode:
                     case InferenceMode.DEFAULT:
-                        llm_generated_output = llm_result.output["content"]
+                        llm_generated_output = llm_output["content"]
                         logger.debug(
                             f"Agent {self.name} - {self.id}:Loop {loop_num + 1}. "
                             f"RAW LLM output:n{llm_generated_output}"
@@ -374,9 +387,9 @@ class ReActAgent(Agent):
                         action, action_input = self._parse_action(llm_generated_output)
 
                     case InferenceMode.FUNCTION_CALLING:
-                        action = llm_result.output["tool_calls"][0]["function"]["name"].strip()
-                        llm_generated_output_json = json.loads(
-                            llm_result.output["tool_calls"][0]["function"]["arguments"]
+                        action = llm_output["tool_calls"][0]["function"]["name"].strip()
+                        llm_generated_output_json = json_parser.loads(
+                            llm_output["tool_calls"][0]["function"]["arguments"]
                         )
                         llm_generated_output = json.dumps(llm_generated_output_json)
                         self.tracing_intermediate(loop_num, formatted_prompt, llm_generated_output)
@@ -403,12 +416,17 @@ class ReActAgent(Agent):
                             return final_answer
 
                         action_input = llm_generated_output_json["action_input"]
+                        tool_calls = [(action, action_input)]
+                        for tool_call in llm_output["tool_calls"][1:]:
+                            tool_call_action, tool_call_input = self._parse_tool_call(tool_call)
+                            if tool_call_action != "provide_final_answer":
+                                tool_calls.append((tool_call_action, tool_call_input))
                         logger.debug(
                             f"Agent {self.name} - {self.id}:Loop {loop_num + 1}. "
                             f"RAW LLM output:n{llm_generated_output}"
                         )
                     case InferenceMode.STRUCTURED_OUTPUT:
-                        llm_generated_output_json = json.loads(llm_result.output["content"])
+                        llm_generated_output_json = json_parser.loads(llm_output["content"])
                         action = llm_generated_output_json["action"]
 
                         self.tracing_intermediate(loop_num, formatted_prompt, llm_generated_output)
@@ -434,11 +452,11 @@ class ReActAgent(Agent):
                                 )
                             return final_answer
 
-                        action_input = json.loads(llm_generated_output_json["action_input"])
+                        action_input = json_parser.loads(llm_generated_output_json["action_input"])
                         llm_generated_output = json.dumps(llm_generated_output_json)
 
                     case InferenceMode.XML:
-                        llm_generated_output = llm_result.output["content"]
+                        llm_generated_output = llm_output["content"]
                         self.tracing_intermediate(loop_num, formatted_prompt, llm_generated_output)
                         if self.streaming.enabled and self.streaming.mode == StreamingMode.ALL:
                             self.stream_content(
@@ -466,10 +484,29 @@ class ReActAgent(Agent):
                     logger.debug(f"Agent {self.name} - {self.id}:Loop {loop_num + 1}. Action:\n{action}")
                     logger.debug(f"Agent {self.name} - {self.id}:Loop {loop_num + 1}. Action Input:\n{action_input}")
 
-                    if self.tools:
+                    if self.tools and len(tool_calls) > 1:
+                        tool_using = [tool_action for tool_action, _ in tool_calls]
+                        tool_input = [
+                            None if isinstance(tool_action_input, Exception) else tool_action_input
+                            for _, tool_action_input in tool_calls
+                        ]
+                        tool_result = self._run_tool_calls(tool_calls, config, **kwargs)
+                        logger.debug(
+                            f"Agent {self.name} - {self.id}:Loop {loop_num + 1}. Tool Results:\n{tool_result}"
+                        )
+                        observation = "".join(
+                            f"\nObservation ({tool_action}): {result}\n"
+                            for tool_action, result in zip(tool_using, tool_result)
+                        )
+                        source = self.name
+                    elif self.tools:
+                        tool_using, tool_input, source = action, action_input, action
                         try:
                             tool = self._get_tool(action)
-                            tool_result = self._run_tool(tool, action_input, config, **kwargs)
+                            source = tool.name
+                            tool_result = self._run_tool_with_trace(
+                                tool, action_input, config, prompt_key=prompt_key, step=loop_num, **kwargs
+                            )
 
                             logger.debug(
                                 f"Agent {self.name} - {self.id}:Loop {loop_num + 1}. Tool Result:\n{tool_result}"
@@ -479,23 +516,24 @@ class ReActAgent(Agent):
                             tool_result = f"{type(e).__name__}: {e}"
 
                         observation = f"\nObservation: {tool_result}\n"
+
+                    if self.tools:
                         llm_generated_output += observation
                         if self.streaming.enabled and self.streaming.mode == StreamingMode.ALL:
                             self.stream_content(
                                 content=observation,
-                                source=tool.name,
+                                source=source,
                                 step=f"tool_{loop_num}",
                                 config=config,
                                 **kwargs,
                             )
 
-                        self._intermediate_steps[loop_num]["model_observation"].update(
-                            AgentIntermediateStepModelObservation(
-                                tool_using=action,
-                                tool_input=action_input,
-                                tool_output=tool_result,
-                                updated=llm_generated_output,
-                            ).model_dump()
+                        self._intermediate_steps.update_observation(
+                            loop_num,
+                            tool_using=tool_using,
+                            tool_input=tool_input,
+                            tool_output=tool_result,
+                            updated=llm_generated_output,
                         )
 
                 previous_responses.append(llm_generated_output)
@@ -523,6 +561,60 @@ class ReActAgent(Agent):
                 )
             return max_loop_final_answer
 
+    @staticmethod
+    def _parse_tool_call(tool_call: dict) -> tuple[str, Any]:
+        """
+        Parses the tool name and input of a function call.
+
+        Args:
+            tool_call (dict): Tool call returned by the LLM.
+
+        Returns:
+            tuple[str, Any]: Tool name and tool input. If the call can not be parsed, the input is
+                an ActionParsingException to be reported as the call observation.
+        """
+        function = tool_call.get("function") or {}
+        action = (function.get("name") or "").strip()
+        try:
+            return action, json_parser.loads(function["arguments"])["action_input"]
+        except (KeyError, TypeError, ValueError) as e:
+            return action, ActionParsingException(f"Failed to parse input of tool call '{action}': {e}")
+
+    def _run_tool_calls(
+        self, tool_calls: list[tuple[str, Any]], config: RunnableConfig | None = None, **kwargs
+    ) -> list[Any]:
+        """
+        Runs tool calls requested by the LLM in one step concurrently.
+
+        Args:
+            tool_calls (list[tuple[str, Any]]): Pairs of tool name and tool input. An exception as the input
+                marks a call that failed to parse.
+            config (RunnableConfig | None): Configuration for the agent run.
+            **kwargs: Additional parameters for running the tools.
+
+        Returns:
+            list: Tool results in the order of tool calls. Recoverable errors are returned as error messages.
+        """
+        results = [None] * len(tool_calls)
+        runnable_calls = []
+        for idx, (action, action_input) in enumerate(tool_calls):
+            if isinstance(action_input, RecoverableAgentException):
+                results[idx] = f"{type(action_input).__name__}: {action_input}"
+                continue
+            try:
+                runnable_calls.append((idx, self._get_tool(action), action_input))
+            except RecoverableAgentException as e:
+                results[idx] = f"{type(e).__name__}: {e}"
+
+        tool_results = self._run_tools([(tool, tool_input) for _, tool, tool_input in runnable_calls], config, **kwargs)
+        for (idx, _, _), tool_result in zip(runnable_calls, tool_results):
+            if isinstance(tool_result, RecoverableAgentException):
+                tool_result = f"{type(tool_result).__name__}: {tool_result}"
+            elif isinstance(tool_result, Exception):
+                raise tool_result
+            results[idx] = tool_result
+        return results
+
     def _handle_max_loops_exceeded(
         self, previous_responses: list, config: RunnableConfig | None = None, **kwargs
     ) -> str:
@@ -1,3 +1,5 @@
+from functools import cached_property, lru_cache
+from types import ModuleType
 from typing import TYPE_CHECKING, Any, Callable, ClassVar, Literal, Union
 
 from pydantic import BaseModel, Field, PrivateAttr, field_validator
@@ -6,13 +8,42 @@ from dynamiq.connections import BaseConnection, HttpApiKey
 from dynamiq.nodes import ErrorHandling, NodeGroup
 from dynamiq.nodes.node import ConnectionNode, ensure_config
 from dynamiq.nodes.types import InferenceMode
-from dynamiq.prompts import Prompt
+from dynamiq.prompts import MessageRole, Prompt
 from dynamiq.runnables import RunnableConfig
 
 if TYPE_CHECKING:
     from litellm import CustomStreamWrapper, ModelResponse
 
 
+@lru_cache(maxsize=None)
+def _lazy_litellm() -> ModuleType:
+    """Import litellm on first use, as it is slow to load."""
+    import litellm
+
+    return litellm
+
+
+@lru_cache(maxsize=64)
+def _unit_price(model: str) -> tuple[float, float] | None:
+    """Get the USD price of a single prompt and completion token for the model.
+
+    Args:
+        model (str): The model to get prices for.
+
+    Returns:
+        tuple[float, float] | None: Prompt and completion token prices or None if the model has tiered pricing,
+            so the token price depends on the prompt size.
+    """
+    litellm = _lazy_litellm()
+    try:
+        model_info = litellm.get_model_info(model)
+    except Exception:
+        model_info = {}
+    if any(value for key, value in model_info.items() if "_above_" in key):
+        return None
+    return litellm.cost_per_token(model=model, prompt_tokens=1, completion_tokens=1)
+
+
 class BaseLLMUsageData(BaseModel):
     """Model for LLM usage data.
 
@@ -23,6 +54,7 @@ class BaseLLMUsageData(BaseModel):
         completion_tokens_cost_usd (float | None): Cost of completion tokens in USD.
         total_tokens (int): Total number of tokens.
         total_tokens_cost_usd (float | None): Total cost of tokens in USD.
+        cache_read_input_tokens (int): Number of prompt tokens read from provider prompt cache.
     """
     prompt_tokens: int
     prompt_tokens_cost_usd: float | None
@@ -30,6 +62,7 @@ class BaseLLMUsageData(BaseModel):
     completion_tokens_cost_usd: float | None
     total_tokens: int
     total_tokens_cost_usd: float | None
+    cache_read_input_tokens: int = 0
 
 
 class BaseLLM(ConnectionNode):
@@ -37,6 +70,10 @@ class BaseLLM(ConnectionNode):
 
     Attributes:
         MODEL_PREFIX (ClassVar[str | None]): Optional model prefix.
+        PROMPT_CACHING_MODEL_PREFIXES (ClassVar[tuple[str, ...]]): Model prefixes that require explicit
+            prompt caching markers.
+        PROMPT_CACHING_HEADERS (ClassVar[dict[str, str]]): Extra headers sent with cache-marked requests.
+        COMPLETION_PARAMS (ClassVar[tuple[str, ...]]): Fields passed to every completion call as is.
         name (str | None): Name of the LLM node. Defaults to "LLM".
         model (str): Model to use for the LLM.
         prompt (Prompt | None): Prompt to use for the LLM.
@@ -59,6 +96,19 @@ class BaseLLM(ConnectionNode):
     """
 
     MODEL_PREFIX: ClassVar[str | None] = None
+    PROMPT_CACHING_MODEL_PREFIXES: ClassVar[tuple[str, ...]] = ("anthropic/", "claude")
+    PROMPT_CACHING_HEADERS: ClassVar[dict[str, str]] = {"anthropic-beta": "prompt-caching-2024-07-31"}
+    COMPLETION_PARAMS: ClassVar[tuple[str, ...]] = (
+        "model",
+        "temperature",
+        "max_tokens",
+        "tool_choice",
+        "stop",
+        "top_p",
+        "seed",
+        "presence_penalty",
+        "frequency_penalty",
+    )
     name: str | None = "LLM"
     model: str
     prompt: Prompt | None = None
@@ -105,11 +155,34 @@ class BaseLLM(ConnectionNode):
         super().__init__(**kwargs)
 
         # Save a bit of loading time as litellm is slow
-        from litellm import completion, stream_chunk_builder
+        litellm = _lazy_litellm()
 
         # Avoid the same imports multiple times and for future usage in execute
-        self._completion = completion
-        self._stream_chunk_builder = stream_chunk_builder
+        self._completion = litellm.completion
+        self._stream_chunk_builder = litellm.stream_chunk_builder
+
+    def __setattr__(self, name: str, value: Any):
+        super().__setattr__(name, value)
+        if name in self.COMPLETION_PARAMS:
+            self.__dict__.pop("completion_params", None)
+
+    def model_copy(self, *, update: dict[str, Any] | None = None, deep: bool = False):
+        """Copy the node, dropping completion parameters cached for the original fields."""
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            copied.__dict__.pop("completion_params", None)
+        return copied
+
+    @cached_property
+    def completion_params(self) -> dict[str, Any]:
+        """Completion parameters that depend only on the node fields.
+
+        Built once and rebuilt only after one of the COMPLETION_PARAMS fields is reassigned or updated on copy.
+
+        Returns:
+            dict[str, Any]: Keyword arguments for the completion call.
+        """
+        return {name: getattr(self, name) for name in self.COMPLETION_PARAMS} | {"drop_params": True}
 
     @classmethod
     def get_usage_data(
@@ -128,17 +201,22 @@ class BaseLLM(ConnectionNode):
         Returns:
             BaseLLMUsageData: A model containing the usage data for the LLM.
         """
-        from litellm import cost_per_token
-
         usage = completion.model_extra["usage"]
         prompt_tokens = usage.prompt_tokens
         completion_tokens = usage.completion_tokens
         total_tokens = usage.total_tokens
+        cache_read_input_tokens = getattr(usage, "cache_read_input_tokens", None)
+        if cache_read_input_tokens is None and (prompt_tokens_details := getattr(usage, "prompt_tokens_details", None)):
+            cache_read_input_tokens = getattr(prompt_tokens_details, "cached_tokens", None)
 
         try:
-            prompt_tokens_cost_usd, completion_tokens_cost_usd = cost_per_token(
-                model=model, prompt_tokens=prompt_tokens, completion_tokens=completion_tokens
-            )
+            if (unit_price := _unit_price(model)) is not None:
+                prompt_tokens_cost_usd = prompt_tokens * unit_price[0]
+                completion_tokens_cost_usd = completion_tokens * unit_price[1]
+            else:
+                prompt_tokens_cost_usd, completion_tokens_cost_usd = _lazy_litellm().cost_per_token(
+                    model=model, prompt_tokens=prompt_tokens, completion_tokens=completion_tokens
+                )
             total_tokens_cost_usd = prompt_tokens_cost_usd + completion_tokens_cost_usd
         except Exception:
             prompt_tokens_cost_usd, completion_tokens_cost_usd, total_tokens_cost_usd = None, None, None
@@ -150,6 +228,7 @@ class BaseLLM(ConnectionNode):
             completion_tokens_cost_usd=completion_tokens_cost_usd,
             total_tokens=total_tokens,
             total_tokens_cost_usd=total_tokens_cost_usd,
+            cache_read_input_tokens=cache_read_input_tokens or 0,
         )
 
     def _handle_completion_response(
@@ -177,6 +256,29 @@ class BaseLLM(ConnectionNode):
 
         return {"content": content, "tool_calls": tool_calls}
 
+    @staticmethod
+    def _is_content_delta_chunk(chunk: "ModelResponse") -> bool:
+        """Check if a streaming chunk carries nothing but a content delta.
+
+        Args:
+            chunk (ModelResponse): The streaming chunk.
+
+        Returns:
+            bool: True if the chunk only holds content, False otherwise.
+        """
+        if not chunk.choices or chunk.choices[0].finish_reason or getattr(chunk, "usage", None):
+            return False
+        if getattr(chunk, "_hidden_params", {}).get("usage"):
+            return False
+
+        delta = chunk.choices[0].delta
+        return (
+            delta.content is not None
+            and not getattr(delta, "tool_calls", None)
+            and not getattr(delta, "function_call", None)
+            and not getattr(delta, "audio", None)
+        )
+
     def _handle_streaming_completion_response(
         self,
         response: Union["ModelResponse", "CustomStreamWrapper"],
@@ -196,15 +298,30 @@ class BaseLLM(ConnectionNode):
             dict: A dictionary containing the generated content and tool calls.
         """
         chunks = []
+        content_chunk = None
+        content_deltas = []
         for chunk in response:
-            chunks.append(chunk)
-
             self.run_on_node_execute_stream(
                 config.callbacks,
                 chunk.model_dump(),
                 **kwargs,
             )
 
+            # Runs of plain content deltas are folded into the first chunk of the run instead of being kept.
+            # The run is closed by any other chunk, so content keeps its order around retained chunks.
+            if self._is_content_delta_chunk(chunk):
+                content_deltas.append(chunk.choices[0].delta.content)
+                if content_chunk is not None:
+                    continue
+                content_chunk = chunk
+            elif content_chunk is not None:
+                content_chunk.choices[0].delta.content = "".join(content_deltas)
+                content_chunk, content_deltas = None, []
+            chunks.append(chunk)
+
+        if content_chunk is not None:
+            content_chunk.choices[0].delta.content = "".join(content_deltas)
+
         full_response = self._stream_chunk_builder(chunks=chunks, messages=messages)
         return self._handle_completion_response(response=full_response, config=config, **kwargs)
 
@@ -238,6 +355,95 @@ class BaseLLM(ConnectionNode):
 
         return response_format, tools
 
+    @property
+    def is_prompt_caching_explicit(self) -> bool:
+        """Whether the model requires explicit markers to cache the prompt prefix on provider side."""
+        return self.model.startswith(self.PROMPT_CACHING_MODEL_PREFIXES)
+
+    @staticmethod
+    def _add_cache_control(message: dict, block_index: int = -1) -> dict:
+        """Mark message content as the end of a cacheable prompt prefix.
+
+        Args:
+            message (dict): The message to mark.
+            block_index (int): Index of the content block that ends the prefix. Defaults to the last one.
+
+        Returns:
+            dict: A copy of the message with `cache_control` set on the content block.
+        """
+        content = message.get("content")
+        if isinstance(content, str):
+            content = [{"type": "text", "text": content}]
+        elif isinstance(content, list) and content:
+            content = list(content)
+        else:
+            return message
+
+        content[block_index] = {**content[block_index], "cache_control": {"type": "ephemeral"}}
+        return {**message, "content": content}
+
+    def get_cacheable_prefix_size(self, messages: list[dict]) -> int:
+        """Get number of leading messages that form a stable, cacheable prompt prefix.
+
+        Providers with automatic prefix caching (e.g. OpenAI) reuse the prefix as long as stable content
+        comes first, so nothing has to be marked for them. For providers with explicit caching (Anthropic)
+        the prefix is formed by leading system messages or, if there are none, by all messages except
+        the last one, which carries the dynamic request. A single message with several content blocks
+        is a prefix on its own: all blocks but the last one are cached.
+
+        Args:
+            messages (list[dict]): Formatted prompt messages.
+
+        Returns:
+            int: Size of the prefix to mark as cacheable, 0 if nothing should be marked.
+        """
+        if not self.is_prompt_caching_explicit or not messages:
+            return 0
+        if len(messages) == 1:
+            content = messages[0].get("content")
+            return 1 if isinstance(content, list) and len(content) > 1 else 0
+
+        prefix_size = 0
+        while prefix_size < len(messages) - 1 and messages[prefix_size].get("role") == MessageRole.SYSTEM.value:
+            prefix_size += 1
+        return prefix_size or len(messages) - 1
+
+    def get_prompt_caching_messages(self, messages: list[dict], prefix_size: int) -> list[dict]:
+        """Mark the last message of the stable prompt prefix with `cache_control`.
+
+        If the prefix spans all messages (a single message), its second to last content block is marked.
+
+        Args:
+            messages (list[dict]): Formatted prompt messages.
+            prefix_size (int): Number of leading messages in the cacheable prefix.
+
+        Returns:
+            list[dict]: Messages prepared for provider-side prompt caching.
+        """
+        messages = list(messages)
+        if prefix_size == len(messages):
+            messages[-1] = self._add_cache_control(messages[-1], block_index=-2)
+        else:
+            messages[prefix_size - 1] = self._add_cache_control(messages[prefix_size - 1])
+        return messages
+
+    def get_prompt_caching_params(self, params: dict[str, Any]) -> dict[str, Any]:
+        """Add prompt caching headers to the completion params, keeping already set headers.
+
+        Args:
+            params (dict[str, Any]): Completion params.
+
+        Returns:
+            dict[str, Any]: Completion params with prompt caching headers.
+        """
+        extra_headers = dict(params.get("extra_headers") or {})
+        for name, value in self.PROMPT_CACHING_HEADERS.items():
+            if not (current := extra_headers.get(name)):
+                extra_headers[name] = value
+            elif value not in current.split(","):
+                extra_headers[name] = f"{current},{value}"
+        return params | {"extra_headers": extra_headers}
+
     def execute(
         self,
         input_data: dict[str, Any],
@@ -283,21 +489,17 @@ class BaseLLM(ConnectionNode):
         )
         tools = tools or base_tools
 
+        completion_messages = messages
+        if prefix_size := self.get_cacheable_prefix_size(messages):
+            completion_messages = self.get_prompt_caching_messages(messages, prefix_size=prefix_size)
+            params = self.get_prompt_caching_params(params)
+
         response = self._completion(
-            model=self.model,
-            messages=messages,
+            messages=completion_messages,
             stream=self.streaming.enabled,
-            temperature=self.temperature,
-            max_tokens=self.max_tokens,
             tools=tools,
-            tool_choice=self.tool_choice,
-            stop=self.stop,
-            top_p=self.top_p,
-            seed=self.seed,
-            presence_penalty=self.presence_penalty,
-            frequency_penalty=self.frequency_penalty,
             response_format=response_format,
-            drop_params=True,
+            **self.completion_params,
             **params,
         )
 
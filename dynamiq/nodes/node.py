@@ -196,6 +196,8 @@ class Node(BaseModel, Runnable, ABC):
         is_postponed_component_init (bool): Whether component initialization is postponed.
         is_optimized_for_agents (bool): Whether to optimize output for agents. By default is set to False.
         supports_files (bool): Whether the node has access to files. By default is set to False.
+        is_idempotent (bool): Whether repeated runs with the same input give the same result without side effects,
+            so agents may reuse the result. By default is set to False.
     """
     id: str = Field(default_factory=generate_uuid)
     name: str | None = None
@@ -213,6 +215,7 @@ class Node(BaseModel, Runnable, ABC):
     is_postponed_component_init: bool = False
     is_optimized_for_agents: bool = False
     is_files_allowed: bool = False
+    is_idempotent: bool = False
 
     _output_references: NodeOutputReferences = PrivateAttr()
 
@@ -44,6 +44,7 @@ class FirecrawlTool(ConnectionNode):
     )
     connection: Firecrawl
     url: str | None = None
+    is_idempotent: bool = True
     input_schema: ClassVar[type[FirecrawlInputSchema]] = FirecrawlInputSchema
 
     # Default parameters
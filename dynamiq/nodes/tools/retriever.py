@@ -32,6 +32,7 @@ class RetrievalTool(Node):
     connection_manager: ConnectionManager | None = None
     text_embedder: ConnectionNode | None = None
     document_retriever: ConnectionNode | None = None
+    is_idempotent: bool = True
     input_schema: ClassVar[type[RetrievalInputSchema]] = RetrievalInputSchema
 
     def __init__(
@@ -55,6 +55,7 @@ class ScaleSerpTool(ConnectionNode):
     )
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
+    is_idempotent: bool = True
     input_schema: ClassVar[type[ScaleSerpInputSchema]] = ScaleSerpInputSchema
 
     def _format_search_results(self, results: dict[str, Any]) -> str:
@@ -68,6 +68,7 @@ class TavilyTool(ConnectionNode):
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
+    is_idempotent: bool = True
     input_schema: ClassVar[type[TavilyInputSchema]] = TavilyInputSchema
 
     def _format_search_results(self, results: dict[str, Any]) -> str:
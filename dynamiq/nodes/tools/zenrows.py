@@ -35,6 +35,7 @@ class ZenRowsTool(ConnectionNode):
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
+    is_idempotent: bool = True
     input_schema: ClassVar[type[ZenRowsInputSchema]] = ZenRowsInputSchema
 
     def execute(self, input_data: ZenRowsInputSchema, config: RunnableConfig = None, **kwargs) -> dict[str, Any]:
@@ -168,8 +168,8 @@ class Prompt(BasePrompt):
     tools: list[Tool] | None = None
     _Template: Any = PrivateAttr()
 
-    def __init__(self, **data):
-        super().__init__(**data)
+    def model_post_init(self, __context: Any) -> None:
+        # Runs for both validated and model_construct instances
         # Import and initialize Jinja2 Template here
         from jinja2 import Template
 
@@ -189,7 +189,7 @@ class Prompt(BasePrompt):
         for msg in self.messages:
             if isinstance(msg, Message):
                 out.append(
-                    Message(
+                    Message.model_construct(
                         role=msg.role,
                         content=self._Template(msg.content).render(**kwargs),
                     ).model_dump(exclude={"metadata"})
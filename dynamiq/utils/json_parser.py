@@ -0,0 +1,52 @@
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+def loads(value: str | bytes) -> Any:
+    """
+    Deserialize JSON document using orjson if available, otherwise the standard json module.
+
+    orjson is stricter than the standard parser (e.g. it rejects NaN and integers above 64 bits),
+    so documents it fails on are passed to the standard parser to keep the same accepted input.
+
+    Args:
+        value (str | bytes): JSON document.
+
+    Returns:
+        Any: Deserialized value.
+
+    Raises:
+        json.JSONDecodeError: If the value is not a valid JSON document.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(value)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(value)
+
+
+def dumps_sorted(value: Any) -> bytes:
+    """
+    Serialize value to a canonical JSON document with sorted keys using orjson if available.
+
+    Values orjson can not serialize (e.g. non-string keys or custom objects) are serialized
+    by the standard json module with unknown objects converted to strings.
+
+    Args:
+        value (Any): Value to serialize.
+
+    Returns:
+        bytes: JSON document.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_SORT_KEYS)
+        except TypeError:
+            pass
+    return json.dumps(value, sort_keys=True, default=str).encode()
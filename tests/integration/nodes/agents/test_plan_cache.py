@@ -0,0 +1,106 @@
+import uuid
+
+import pytest
+
+from dynamiq import connections
+from dynamiq.cache.config import InMemoryCacheConfig
+from dynamiq.nodes.agents.orchestrators.linear_manager import LinearAgentManager
+from dynamiq.nodes.llms import OpenAI
+from dynamiq.runnables import RunnableStatus
+
+
+@pytest.fixture
+def manager():
+    llm = OpenAI(
+        name="OpenAI",
+        model="gpt-4o-mini",
+        connection=connections.OpenAI(id=str(uuid.uuid4()), api_key="api-key"),
+    )
+    return LinearAgentManager(llm=llm, plan_cache=InMemoryCacheConfig())
+
+
+@pytest.mark.parametrize(
+    ("first_task", "second_task", "second_agents", "expected_call_count"),
+    [
+        (
+            "Research latest trends in renewable energy",
+            "Research latest trends in renewable energy",
+            "0. Researcher",
+            1,
+        ),
+        (
+            "Research latest trends in renewable energy",
+            "  research latest TRENDS in renewable\nenergy ",
+            "0. Researcher",
+            1,
+        ),
+        (
+            "Research latest trends in renewable energy storage markets",
+            "Please research the latest trends in renewable energy storage markets globally",
+            "0. Researcher",
+            2,
+        ),
+        ("Convert 100 USD to EUR", "Convert 5000 USD to EUR", "0. Researcher", 2),
+        ("Plan a trip from London to Paris", "Plan a trip from Paris to London", "0. Researcher", 2),
+        ("Research latest trends in renewable energy", "Write poem about winter forest", "0. Researcher", 2),
+        ("Research latest trends in renewable energy", "Research latest trends in renewable energy", "0. Writer", 2),
+    ],
+)
+def test_manager_plan_cache(
+    manager, mock_llm_executor, mock_llm_response_text, first_task, second_task, second_agents, expected_call_count
+):
+    first_result = manager.run(input_data={"action": "plan", "input_task": first_task, "agents": "0. Researcher"})
+    second_result = manager.run(input_data={"action": "plan", "input_task": second_task, "agents": second_agents})
+
+    assert first_result.status == RunnableStatus.SUCCESS
+    assert second_result.status == RunnableStatus.SUCCESS
+    assert second_result.output["content"]["result"] == mock_llm_response_text
+    assert mock_llm_executor.call_count == expected_call_count
+
+
+def test_manager_plan_cache_skips_other_actions(manager, mock_llm_executor):
+    for _ in range(2):
+        manager.run(input_data={"action": "final", "input_task": "Research trends", "tasks_outputs": ""})
+
+    assert mock_llm_executor.call_count == 2
+
+
+def test_manager_plan_cache_adapts_similar_task_plan(manager, mock_llm_executor, mock_llm_response_text):
+    manager.plan_cache_similarity_threshold = 0.5
+    manager.run(input_data={"action": "plan", "input_task": "Convert 100 USD to EUR", "agents": "0. Researcher"})
+    result = manager.run(
+        input_data={"action": "plan", "input_task": "Convert 5000 USD to EUR", "agents": "0. Researcher"}
+    )
+
+    assert result.status == RunnableStatus.SUCCESS
+    assert result.output["content"]["result"] == mock_llm_response_text
+    assert mock_llm_executor.call_count == 2
+    adapter_prompt = mock_llm_executor.call_args.kwargs["messages"][0]["content"]
+    assert "PREVIOUS TASK:\nConvert 100 USD to EUR" in adapter_prompt
+    assert "NEW TASK:\nConvert 5000 USD to EUR" in adapter_prompt
+    assert mock_llm_response_text in adapter_prompt
+
+
+def test_manager_plan_cache_skips_write_on_hit(manager, mock_llm_executor, mocker):
+    set_response = mocker.spy(manager.plan_cache_manager, "set_response")
+    for _ in range(2):
+        manager.run(input_data={"action": "plan", "input_task": "Research trends", "agents": "0. Researcher"})
+
+    assert mock_llm_executor.call_count == 1
+    assert set_response.call_count == 1
+
+
+def test_manager_plan_cache_index_shared_through_cache(manager, mock_llm_executor):
+    manager.plan_cache_similarity_threshold = 0.5
+    manager.run(input_data={"action": "plan", "input_task": "Convert 100 USD to EUR", "agents": "0. Researcher"})
+
+    other_manager = LinearAgentManager(
+        llm=manager.llm, plan_cache=manager.plan_cache, plan_cache_similarity_threshold=0.5
+    )
+    other_manager._plan_cache_manager = manager.plan_cache_manager
+    other_manager.run(
+        input_data={"action": "plan", "input_task": "Convert 5000 USD to EUR", "agents": "0. Researcher"}
+    )
+
+    adapter_prompt = mock_llm_executor.call_args.kwargs["messages"][0]["content"]
+    assert "PREVIOUS TASK:\nConvert 100 USD to EUR" in adapter_prompt
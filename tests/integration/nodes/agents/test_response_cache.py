@@ -0,0 +1,156 @@
+import uuid
+
+import pytest
+
+from dynamiq import connections, prompts
+from dynamiq.cache.config import InMemoryCacheConfig
+from dynamiq.cache.semantic import SemanticCache
+from dynamiq.nodes.agents.orchestrators.linear_manager import LinearAgentManager
+from dynamiq.nodes.agents.react import ReActAgent
+from dynamiq.nodes.agents.simple import SimpleAgent
+from dynamiq.nodes.llms import OpenAI
+from dynamiq.runnables import RunnableStatus
+
+
+def get_llm(temperature: float, seed: int | None) -> OpenAI:
+    return OpenAI(
+        name="OpenAI",
+        model="gpt-4o-mini",
+        connection=connections.OpenAI(id=str(uuid.uuid4()), api_key="api-key"),
+        prompt=prompts.Prompt(messages=[prompts.Message(role="user", content="{{input}}")]),
+        temperature=temperature,
+        seed=seed,
+    )
+
+
+def get_agent(temperature: float, seed: int | None) -> SimpleAgent:
+    return SimpleAgent(name="Agent", llm=get_llm(temperature, seed), response_cache=InMemoryCacheConfig())
+
+
+@pytest.mark.parametrize(
+    ("temperature", "seed", "expected_call_count"),
+    [
+        (0, 42, 1),
+        (0.1, 42, 1),
+        (0, None, 1),
+        (0.1, None, 2),
+    ],
+)
+def test_agent_response_cache(mock_llm_executor, mock_llm_response_text, temperature, seed, expected_call_count):
+    agent = get_agent(temperature=temperature, seed=seed)
+
+    for _ in range(2):
+        result = agent.run(input_data={"input": "What is LLM?"})
+        assert result.status == RunnableStatus.SUCCESS
+        assert result.output["content"] == mock_llm_response_text
+
+    assert mock_llm_executor.call_count == expected_call_count
+
+
+def test_agent_response_cache_prompt_change(mock_llm_executor):
+    agent = get_agent(temperature=0, seed=42)
+
+    agent.run(input_data={"input": "What is LLM?"})
+    agent.run(input_data={"input": "What is AI?"})
+    agent.run(input_data={"input": "What is LLM?"})
+
+    assert mock_llm_executor.call_count == 2
+    assert agent.response_cache_manager.hits == 1
+    assert agent.response_cache_manager.misses == 2
+
+
+@pytest.mark.parametrize(
+    ("field", "value"),
+    [
+        ("max_tokens", 10),
+        ("stop", ["\n"]),
+        ("presence_penalty", 0.5),
+        ("frequency_penalty", 0.5),
+        ("schema_", {"type": "object"}),
+    ],
+)
+def test_agent_response_cache_llm_params_change(mock_llm_executor, field, value):
+    agent = get_agent(temperature=0, seed=42)
+
+    agent.run(input_data={"input": "What is LLM?"})
+    setattr(agent.llm, field, value)
+    agent.run(input_data={"input": "What is LLM?"})
+
+    assert mock_llm_executor.call_count == 2
+    assert agent.response_cache_manager.hits == 0
+
+
+class KeywordEmbedder:
+    """Embeds text as counts of a fixed keyword vocabulary."""
+
+    VOCABULARY = ("llm", "ai", "what", "is", "explain")
+
+    def embed_text(self, text: str) -> dict:
+        words = text.lower().replace("?", " ").split()
+        return {"embedding": [words.count(word) for word in self.VOCABULARY], "meta": {}}
+
+
+def test_agent_semantic_cache(mock_llm_executor, mock_llm_response_text):
+    agent = get_agent(temperature=0, seed=None)
+    agent.response_cache = None
+    agent.semantic_cache = SemanticCache(embedder=KeywordEmbedder(), similarity_threshold=0.9)
+
+    for question in ("What is LLM?", "what is  llm", "Explain AI"):
+        result = agent.run(input_data={"input": question})
+        assert result.status == RunnableStatus.SUCCESS
+        assert result.output["content"] == mock_llm_response_text
+
+    assert mock_llm_executor.call_count == 2
+    assert agent.semantic_cache.hits == 1
+    assert agent.semantic_cache.misses == 2
+    assert len(agent.semantic_cache) == 2
+
+
+def test_agent_semantic_cache_scoped_by_llm_params_and_instructions(mock_llm_executor):
+    semantic_cache = SemanticCache(embedder=KeywordEmbedder(), similarity_threshold=0.9)
+    agents = [get_agent(temperature=0, seed=None) for _ in range(3)]
+    agents[1].llm.model = "gpt-4o"
+    agents[2].add_block("instructions", "Answer briefly.")
+    for agent in agents:
+        agent.response_cache = None
+        agent.semantic_cache = semantic_cache
+        agent.run(input_data={"input": "What is LLM?"})
+
+    agents[0].run(input_data={"input": "what is  llm"})
+
+    assert mock_llm_executor.call_count == 3
+    assert semantic_cache.hits == 1
+    assert len(semantic_cache) == 3
+
+
+def test_semantic_cache_evicts_oldest_entry_across_scopes():
+    semantic_cache = SemanticCache(embedder=KeywordEmbedder(), similarity_threshold=0.9, max_size=2)
+    semantic_cache.set("what is llm", "first", scope="a")
+    semantic_cache.set("what is llm", "second", scope="b")
+    semantic_cache.set("explain ai", "third", scope="a")
+
+    assert len(semantic_cache) == 2
+    assert semantic_cache.get("what is llm", scope="a") is None
+    assert semantic_cache.get("what is llm", scope="b") == "second"
+    assert semantic_cache.get("explain ai", scope="a") == "third"
+
+
+def test_manager_semantic_cache_not_supported():
+    with pytest.raises(ValueError):
+        LinearAgentManager(
+            llm=get_llm(temperature=0, seed=None),
+            semantic_cache=SemanticCache(embedder=KeywordEmbedder()),
+        )
+
+
+@pytest.mark.parametrize("mock_llm_response_text", ["Thought: I know the answer.\nAnswer: 42"])
+def test_react_agent_response_cache(mock_llm_executor):
+    agent = ReActAgent(name="Agent", llm=get_llm(temperature=0, seed=None), response_cache=InMemoryCacheConfig())
+
+    for _ in range(2):
+        result = agent.run(input_data={"input": "What is the answer?"})
+        assert result.status == RunnableStatus.SUCCESS
+        assert result.output["content"] == "42"
+
+    assert mock_llm_executor.call_count == 1
+    assert agent.response_cache_manager.hits == 1
@@ -0,0 +1,131 @@
+import uuid
+
+import pytest
+
+from dynamiq import Workflow, connections
+from dynamiq.callbacks import TracingCallbackHandler
+from dynamiq.flows import Flow
+from dynamiq.nodes.llms import Anthropic
+from dynamiq.prompts import (
+    Message,
+    MessageRole,
+    Prompt,
+    VisionMessage,
+    VisionMessageTextContent,
+)
+from dynamiq.runnables import RunnableConfig, RunnableResult, RunnableStatus
+
+
+@pytest.mark.parametrize(
+    ("messages", "expected_messages", "expected_params"),
+    [
+        (
+            [Message(role=MessageRole.USER, content="What is LLM?")],
+            [{"role": MessageRole.USER, "content": "What is LLM?"}],
+            {},
+        ),
+        (
+            [
+                Message(role=MessageRole.SYSTEM, content="You are a helpful assistant."),
+                Message(role=MessageRole.USER, content="What is LLM?"),
+            ],
+            [
+                {
+                    "role": MessageRole.SYSTEM,
+                    "content": [
+                        {
+                            "type": "text",
+                            "text": "You are a helpful assistant.",
+                            "cache_control": {"type": "ephemeral"},
+                        }
+                    ],
+                },
+                {"role": MessageRole.USER, "content": "What is LLM?"},
+            ],
+            {"extra_headers": {"anthropic-beta": "prompt-caching-2024-07-31"}},
+        ),
+        (
+            [
+                VisionMessage(
+                    content=[
+                        VisionMessageTextContent(text="You are a helpful assistant."),
+                        VisionMessageTextContent(text="What is LLM?"),
+                    ]
+                )
+            ],
+            [
+                {
+                    "role": MessageRole.USER,
+                    "content": [
+                        {
+                            "type": "text",
+                            "text": "You are a helpful assistant.",
+                            "cache_control": {"type": "ephemeral"},
+                        },
+                        {"type": "text", "text": "What is LLM?"},
+                    ],
+                },
+            ],
+            {"extra_headers": {"anthropic-beta": "prompt-caching-2024-07-31"}},
+        ),
+    ],
+)
+def test_workflow_with_anthropic_llm_prompt_caching(
+    mock_llm_response_text, mock_llm_executor, messages, expected_messages, expected_params
+):
+    model = "claude-3-5-sonnet-20240620"
+    connection = connections.Anthropic(id=str(uuid.uuid4()), api_key="api_key")
+    wf_anthropic = Workflow(
+        flow=Flow(
+            nodes=[Anthropic(name="Anthropic", model=model, connection=connection, prompt=Prompt(messages=messages))]
+        ),
+    )
+
+    response = wf_anthropic.run(input_data={}, config=RunnableConfig(callbacks=[TracingCallbackHandler()]))
+
+    expected_result = RunnableResult(
+        status=RunnableStatus.SUCCESS,
+        input={},
+        output={"content": mock_llm_response_text, "tool_calls": None},
+    ).to_dict()
+    assert response.output == {wf_anthropic.flow.nodes[0].id: expected_result}
+    mock_llm_executor.assert_called_once_with(
+        tools=None,
+        tool_choice=None,
+        model=model,
+        messages=expected_messages,
+        stream=False,
+        temperature=0.1,
+        max_tokens=1000,
+        stop=None,
+        seed=None,
+        frequency_penalty=None,
+        presence_penalty=None,
+        top_p=None,
+        api_key=connection.api_key,
+        response_format=None,
+        drop_params=True,
+        **expected_params,
+    )
+
+
+@pytest.mark.parametrize(
+    ("extra_headers", "expected_extra_headers"),
+    [
+        (None, {"anthropic-beta": "prompt-caching-2024-07-31"}),
+        ({"x-request-id": "1"}, {"x-request-id": "1", "anthropic-beta": "prompt-caching-2024-07-31"}),
+        (
+            {"anthropic-beta": "max-tokens-3-5-sonnet-2024-07-15"},
+            {"anthropic-beta": "max-tokens-3-5-sonnet-2024-07-15,prompt-caching-2024-07-31"},
+        ),
+        ({"anthropic-beta": "prompt-caching-2024-07-31"}, {"anthropic-beta": "prompt-caching-2024-07-31"}),
+    ],
+)
+def test_anthropic_prompt_caching_params_keep_extra_headers(extra_headers, expected_extra_headers):
+    llm = Anthropic(
+        model="claude-3-5-sonnet-20240620", connection=connections.Anthropic(id=str(uuid.uuid4()), api_key="api_key")
+    )
+    params = {"api_key": "api_key", "extra_headers": extra_headers}
+
+    assert llm.get_prompt_caching_params(params) == {"api_key": "api_key", "extra_headers": expected_extra_headers}
+    assert params["extra_headers"] == extra_headers
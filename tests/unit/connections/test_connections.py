@@ -4,7 +4,10 @@ import pytest
 
 from dynamiq.connections.connections import Milvus as MilvusConnection
 from dynamiq.connections.connections import MilvusDeploymentType
+from dynamiq.connections.connections import OpenAI as OpenAIConnection
 from dynamiq.connections.connections import Qdrant as QdrantConnection
+from dynamiq.connections.connections import get_shared_http_client, get_shared_http_client_limits
+from dynamiq.connections.managers import get_connection_manager
 
 
 @pytest.fixture
@@ -98,3 +101,37 @@ def test_milvus_connect_host_without_token(mock_milvus_client_class):
 def test_milvus_connect_file_invalid_uri():
     with pytest.raises(ValueError, match="For FILE deployment, URI should point to a file ending with '.db'"):
         MilvusConnection(deployment_type=MilvusDeploymentType.FILE, uri="not_a_db_path")
+
+
+def test_openai_connect_shares_http_client():
+    first_client = OpenAIConnection(api_key="first_api_key").connect()
+    second_client = OpenAIConnection(api_key="second_api_key").connect()
+
+    assert first_client.api_key == "first_api_key"
+    assert second_client.api_key == "second_api_key"
+    assert first_client._client is second_client._client is get_shared_http_client()
+
+
+def test_shared_http_client_survives_connection_manager_close():
+    with get_connection_manager() as connection_manager:
+        client = connection_manager.get_connection_client(OpenAIConnection(api_key="api_key"))
+    assert not client._client.is_closed
+
+    new_client = OpenAIConnection(api_key="api_key").connect()
+    assert new_client._client is client._client
+    assert not new_client._client.is_closed
+
+
+def test_shared_http_client_rebuilt_after_force_close():
+    http_client = get_shared_http_client()
+    http_client.force_close()
+
+    new_http_client = get_shared_http_client()
+    assert new_http_client is not http_client
+    assert not new_http_client.is_closed
+
+
+def test_shared_http_client_limits_from_env(monkeypatch):
+    monkeypatch.setenv("DYNAMIQ_HTTP_MAX_CONNECTIONS", "10")
+    monkeypatch.setenv("DYNAMIQ_HTTP_MAX_KEEPALIVE_CONNECTIONS", "5")
+    assert get_shared_http_client_limits() == {"max_connections": 10, "max_keepalive_connections": 5}
@@ -0,0 +1,373 @@
+import json
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from litellm import ModelResponse
+
+from dynamiq import connections
+from dynamiq.cache.config import InMemoryCacheConfig
+from dynamiq.nodes.agents.base import (
+    AgentIntermediateStep,
+    AgentIntermediateStepModelObservation,
+    AgentIntermediateSteps,
+    _render_prompt_template,
+)
+from dynamiq.nodes.agents.exceptions import ActionParsingException, ToolExecutionException
+from dynamiq.nodes.agents.react import ReActAgent
+from dynamiq.nodes.agents.simple import SimpleAgent
+from dynamiq.nodes.llms import Anthropic, OpenAI
+from dynamiq.nodes.tools.python import Python
+from dynamiq.nodes.types import InferenceMode
+from dynamiq.runnables import RunnableStatus
+
+
+@pytest.fixture
+def agent():
+    llm = OpenAI(
+        name="OpenAI",
+        model="gpt-4o-mini",
+        connection=connections.OpenAI(id=str(uuid.uuid4()), api_key="api-key"),
+    )
+    return SimpleAgent(name="Agent", llm=llm)
+
+
+@pytest.mark.parametrize(
+    ("output", "expected_action", "expected_action_input"),
+    [
+        ('Thought: search\nAction: Search\nAction Input: {"query": "AI"}', "Search", {"query": "AI"}),
+        (
+            'Thought: search\nAction: Search\nAction Input: {\n  "query": "AI",\n  "filters": {"year": 2024}\n}\n',
+            "Search",
+            {"query": "AI", "filters": {"year": 2024}},
+        ),
+        ('Action: Search\nAction Input: ```json\n{"query": "AI"}\n```', "Search", {"query": "AI"}),
+        (
+            'Action: Search\nAction Input: {"query": "a } b {"}\nObservation: {"result": 1}',
+            "Search",
+            {"query": "a } b {"},
+        ),
+        ('Action: Search\nAction Input: {"query": "say \\"{hi\\""}', "Search", {"query": 'say "{hi"'}),
+    ],
+)
+def test_parse_action(agent, output, expected_action, expected_action_input):
+    assert agent._parse_action(output) == (expected_action, expected_action_input)
+
+
+@pytest.mark.parametrize(
+    "output",
+    [
+        "Thought: I have no action",
+        "Action: Search\nAction Input: query",
+        "Action: Search\nAction Input: {" + "a" * 100_000,
+    ],
+)
+def test_parse_action_invalid(agent, output):
+    with pytest.raises(ActionParsingException):
+        agent._parse_action(output)
+
+
+def test_extract_final_answer(agent):
+    assert agent._extract_final_answer("Thought: done\nAnswer: 42\nlines") == "42\nlines"
+    assert agent._extract_final_answer("Thought: done") == ""
+
+
+def test_tools_cache_reset(agent):
+    assert agent.tool_names == ""
+
+    agent.add_tool(Python(name="Code Runner", code="def run(input_data): return 1"))
+    assert agent.tool_names == "Code-Runner"
+    assert list(agent.tool_by_names) == ["Code-Runner"]
+
+    assert "Code Runner:" in agent.generate_prompt(input="What is AI?")
+
+    agent.tools = [Python(name="Calculator", code="def run(input_data): return 2")]
+    assert agent.tool_names == "Calculator"
+    assert agent.tool_description.startswith("Calculator:")
+    prompt = agent.generate_prompt(input="What is AI?")
+    assert "Calculator:" in prompt
+    assert "Code Runner:" not in prompt
+
+
+def test_generate_prompt_whitespace_normalization(agent):
+    agent._prompt_blocks = {"instructions": "  first\tline  \n\n   \r\n  second   line\n", "request": "{input}"}
+
+    prompt = agent.generate_prompt(input="  What   is AI?  ")
+
+    assert prompt == "INSTRUCTIONS:\nfirst line\nsecond line\nREQUEST:\nWhat is AI?"
+
+
+def test_generate_prompt_static_prefix(agent):
+    agent._prompt_blocks = {"introduction": "Intro", "role": "", "tools": "{tool_description}", "request": "{input}"}
+
+    assert agent.generate_prompt(input="first") == "INTRODUCTION:\nIntro\nTOOLS:\nREQUEST:\nfirst"
+    assert agent.generate_prompt(input="second") == "INTRODUCTION:\nIntro\nTOOLS:\nREQUEST:\nsecond"
+
+    agent.add_block("role", "Researcher")
+    assert agent.generate_prompt(input="third") == "INTRODUCTION:\nIntro\nROLE:\nResearcher\nTOOLS:\nREQUEST:\nthird"
+    assert agent.generate_prompt(block_names=["request"], input="fourth") == "REQUEST:\nfourth"
+
+
+def test_run_tools(agent):
+    first = Python(name="First", code="def run(input_data): return input_data['value'] * 2")
+    second = Python(name="Second", code="def run(input_data): return 1 / 0")
+    third = Python(name="Third", code="def run(input_data): return input_data['value'] + 1")
+
+    results = agent._run_tools([(first, {"value": 2}), (second, {}), (third, {"value": 2})], config=None)
+
+    assert results[0] == 4
+    assert isinstance(results[1], ToolExecutionException)
+    assert results[2] == 3
+    assert [depend["node"]["id"] for depend in agent._run_depends] == [first.id, second.id, third.id]
+
+
+def test_intermediate_steps_as_legacy_dict():
+    steps = AgentIntermediateSteps()
+    steps.add(0, input_data={"prompt": "first"}, initial="Thought: search")
+    steps.update_observation(0, tool_using="Search", tool_input={"query": "AI"}, tool_output="result", updated="done")
+    steps.add(1, input_data={"prompt": "second"}, initial="Answer: 42")
+    steps.set_final_answer(1, "42")
+
+    assert len(steps) == 2
+    assert steps.as_legacy_dict() == {
+        0: AgentIntermediateStep(
+            input_data={"prompt": "first"},
+            model_observation=AgentIntermediateStepModelObservation(
+                initial="Thought: search",
+                tool_using="Search",
+                tool_input={"query": "AI"},
+                tool_output="result",
+                updated="done",
+            ),
+        ).model_dump(),
+        1: AgentIntermediateStep(
+            input_data={"prompt": "second"},
+            model_observation=AgentIntermediateStepModelObservation(initial="Answer: 42"),
+            final_answer="42",
+        ).model_dump(),
+    }
+
+
+def test_run_tool_with_trace(mocker, agent):
+    agent.response_cache = InMemoryCacheConfig()
+    agent.llm.temperature = 0
+    run_tool = mocker.spy(SimpleAgent, "_run_tool")
+    tool = Python(name="Doubler", code="def run(input_data): return input_data['value'] * 2", is_idempotent=True)
+    prompt_key = agent._get_response_cache_key("prompt")
+
+    assert agent._run_tool_with_trace(tool, {"value": 2}, None, prompt_key=prompt_key, step=0) == 4
+    assert agent._run_tool_with_trace(tool, {"value": 2}, None, prompt_key=prompt_key, step=0) == 4
+    assert run_tool.call_count == 1
+
+    assert agent._run_tool_with_trace(tool, {"value": 3}, None, prompt_key=prompt_key, step=0) == 6
+    assert agent._run_tool_with_trace(tool, {"value": 3}, None, prompt_key=prompt_key, step=1) == 6
+    assert agent._run_tool_with_trace(tool, {"value": 3}, None, prompt_key=None, step=1) == 6
+    assert run_tool.call_count == 4
+
+
+def test_run_tool_with_trace_skips_non_idempotent_tools(mocker, agent):
+    agent.response_cache = InMemoryCacheConfig()
+    agent.llm.temperature = 0
+    run_tool = mocker.spy(SimpleAgent, "_run_tool")
+    tool = Python(name="Doubler", code="def run(input_data): return input_data['value'] * 2")
+    prompt_key = agent._get_response_cache_key("prompt")
+
+    assert agent._run_tool_with_trace(tool, {"value": 2}, None, prompt_key=prompt_key, step=0) == 4
+    assert agent._run_tool_with_trace(tool, {"value": 2}, None, prompt_key=prompt_key, step=0) == 4
+    assert run_tool.call_count == 2
+    assert agent.response_cache_manager.get_tool_trace(prompt_key, 0) is None
+
+
+def test_run_tool_with_trace_ignores_cache_write_failure(agent):
+    agent.response_cache = InMemoryCacheConfig()
+    agent.llm.temperature = 0
+    tool = Python(name="Letters", code="def run(input_data): return set(input_data['word'])", is_idempotent=True)
+    prompt_key = agent._get_response_cache_key("prompt")
+
+    assert agent._run_tool_with_trace(tool, {"word": "aa"}, None, prompt_key=prompt_key, step=0) == {"a"}
+    assert agent.response_cache_manager.get_tool_trace(prompt_key, 0) is None
+
+
+def test_reset_run_state_refreshes_prompt_date(agent):
+    today = datetime.now(timezone.utc).date().isoformat()
+    assert agent._prompt_blocks["date"] == today
+
+    agent._prompt_date = agent._prompt_blocks["date"] = "2000-01-01"
+    agent.reset_run_state()
+    assert agent._prompt_blocks["date"] == today
+
+    agent.add_block("date", "Custom date")
+    agent.reset_run_state()
+    assert agent._prompt_blocks["date"] == "Custom date"
+
+
+@pytest.mark.parametrize(
+    ("template", "variables"),
+    [
+        ("User request: {input}", {"input": "What is AI?"}),
+        ("{{literal}} {a}{b} end", {"a": 1, "b": None}),
+        ("Score: {score:.2f} {name!r}", {"score": 0.5, "name": "x"}),
+        ("No variables", {}),
+    ],
+)
+def test_render_prompt_template(template, variables):
+    assert _render_prompt_template(template, variables) == template.format_map(variables)
+
+
+def test_run_tool_reuses_calls_within_run(mocker, agent):
+    tool = Python(name="Doubler", code="def run(input_data): return input_data['value'] * 2", is_idempotent=True)
+    tool_run = mocker.spy(Python, "run")
+
+    assert agent._run_tool(tool, {"value": 2}, None) == 4
+    assert agent._run_tool(tool, {"value": 2}, None) == 4
+    assert agent._run_tool(tool, {"value": 3}, None) == 6
+    assert tool_run.call_count == 2
+
+    agent.reset_run_state()
+    assert agent._run_tool(tool, {"value": 2}, None) == 4
+    assert tool_run.call_count == 3
+
+
+def test_run_tool_reruns_non_idempotent_calls(mocker, agent):
+    tool = Python(name="Doubler", code="def run(input_data): return input_data['value'] * 2")
+    tool_run = mocker.spy(Python, "run")
+
+    assert agent._run_tool(tool, {"value": 2}, None) == 4
+    assert agent._run_tool(tool, {"value": 2}, None) == 4
+    assert tool_run.call_count == 2
+    assert not agent._tool_call_cache
+
+
+def test_normalize_prompt_long_whitespace_runs_are_linear(agent):
+    prompt = "start" + " " * 200_000 + "middle" + " \t\r\n" * 50_000 + "end"
+
+    started_at = time.perf_counter()
+    assert agent._normalize_prompt(prompt) == "start middle\nend"
+    assert time.perf_counter() - started_at < 1
+
+
+def get_tool_calls_response(*tool_calls: tuple[str, dict | str]) -> ModelResponse:
+    return ModelResponse(
+        choices=[
+            {
+                "message": {
+                    "role": "assistant",
+                    "content": None,
+                    "tool_calls": [
+                        {
+                            "id": str(idx),
+                            "type": "function",
+                            "function": {
+                                "name": name,
+                                "arguments": args if isinstance(args, str) else json.dumps(args),
+                            },
+                        }
+                        for idx, (name, args) in enumerate(tool_calls)
+                    ],
+                }
+            }
+        ]
+    )
+
+
+def test_react_agent_runs_function_calls_concurrently(mocker, agent, mock_llm_executor):
+    barrier = threading.Barrier(2, timeout=5)
+
+    def run_tool(self, tool, tool_input, config, run_depends=None, **kwargs):
+        barrier.wait()
+        return f"{tool.name}: {tool_input['value'] * 2}"
+
+    mocker.patch.object(ReActAgent, "_run_tool", run_tool)
+    mock_llm_executor.side_effect = [
+        get_tool_calls_response(
+            ("A", {"thought": "double both", "action_input": {"value": 2}}),
+            ("B", {"thought": "double both", "action_input": {"value": 3}}),
+            ("Unknown", {"thought": "double both", "action_input": {"value": 4}}),
+        ),
+        get_tool_calls_response(("provide_final_answer", {"thought": "done", "answer": "4 and 6"})),
+    ]
+    tools = [Python(name=name, code="def run(input_data): return input_data['value'] * 2") for name in ("A", "B")]
+    react_agent = ReActAgent(
+        name="Agent", llm=agent.llm, tools=tools, inference_mode=InferenceMode.FUNCTION_CALLING, max_loops=2
+    )
+
+    result = react_agent.run(input_data={"input": "Double 2 and 3"})
+
+    assert result.status == RunnableStatus.SUCCESS
+    assert result.output["content"] == "4 and 6"
+    assert mock_llm_executor.call_count == 2
+    observation = react_agent._intermediate_steps.as_legacy_dict()[0]["model_observation"]
+    assert observation["tool_using"] == ["A", "B", "Unknown"]
+    assert observation["tool_output"][:2] == ["A: 4", "B: 6"]
+    assert observation["tool_output"][2].startswith("AgentUnknownToolException")
+
+
+def test_run_tools_serializes_calls_of_same_tool_and_caps_workers(mocker, agent):
+    lock = threading.Lock()
+    running, max_running = {}, {}
+
+    def run_tool(self, tool, tool_input, config, run_depends=None, **kwargs):
+        with lock:
+            running[tool.name] = running.get(tool.name, 0) + 1
+            running["total"] = running.get("total", 0) + 1
+            for key in (tool.name, "total"):
+                max_running[key] = max(max_running.get(key, 0), running[key])
+        time.sleep(0.02)
+        with lock:
+            running[tool.name] -= 1
+            running["total"] -= 1
+        return tool_input["value"]
+
+    mocker.patch.object(SimpleAgent, "_run_tool", run_tool)
+    mocker.patch.object(SimpleAgent, "TOOL_CALLS_MAX_WORKERS", 2)
+    tools = [Python(name=name, code="def run(input_data): return 0") for name in ("A", "B", "C")]
+    tool_calls = [(tool, {"value": idx}) for idx, tool in enumerate((tools[0], tools[0], tools[1], tools[2]))]
+
+    assert agent._run_tools(tool_calls, None) == [0, 1, 2, 3]
+    assert max_running["A"] == 1
+    assert max_running["total"] == 2
+    assert len(agent._run_depends) == 3
+
+
+def test_react_agent_reports_malformed_function_calls(agent, mock_llm_executor):
+    mock_llm_executor.side_effect = [
+        get_tool_calls_response(
+            ("Doubler", {"thought": "double", "action_input": {"value": 2}}),
+            ("Doubler", "{not json"),
+            ("Doubler", {"thought": "double"}),
+        ),
+        get_tool_calls_response(("provide_final_answer", {"thought": "done", "answer": "4"})),
+    ]
+    tool = Python(name="Doubler", code="def run(input_data): return input_data['value'] * 2")
+    react_agent = ReActAgent(
+        name="Agent", llm=agent.llm, tools=[tool], inference_mode=InferenceMode.FUNCTION_CALLING, max_loops=2
+    )
+
+    result = react_agent.run(input_data={"input": "Double 2"})
+
+    assert result.status == RunnableStatus.SUCCESS
+    assert result.output["content"] == "4"
+    observation = react_agent._intermediate_steps.as_legacy_dict()[0]["model_observation"]
+    assert observation["tool_input"] == [{"value": 2}, None, None]
+    assert observation["tool_output"][0] == "4"
+    assert all(output.startswith("ActionParsingException") for output in observation["tool_output"][1:])
+
+
+def test_agent_sends_static_prompt_prefix_as_cacheable_message(mock_llm_executor):
+    llm = Anthropic(
+        model="claude-3-5-sonnet-20240620", connection=connections.Anthropic(id=str(uuid.uuid4()), api_key="api-key")
+    )
+    agent = SimpleAgent(name="Agent", llm=llm, role="Helpful assistant")
+
+    result = agent.run(input_data={"input": "What is LLM?"})
+
+    assert result.status == RunnableStatus.SUCCESS
+    system_message, user_message = mock_llm_executor.call_args.kwargs["messages"]
+    assert system_message["role"] == "system"
+    assert system_message["content"][-1]["cache_control"] == {"type": "ephemeral"}
+    assert "What is LLM?" not in system_message["content"][-1]["text"]
+    assert user_message["role"] == "user"
+    assert "What is LLM?" in user_message["content"]
+    assert mock_llm_executor.call_args.kwargs["extra_headers"] == Anthropic.PROMPT_CACHING_HEADERS
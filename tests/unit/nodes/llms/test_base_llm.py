@@ -0,0 +1,123 @@
+import uuid
+
+import litellm
+import pytest
+from litellm import ModelResponse, Usage
+from litellm.types.utils import Delta
+
+from dynamiq import connections, prompts
+from dynamiq.nodes.llms import OpenAI
+from dynamiq.nodes.node import StreamingConfig
+from dynamiq.runnables import RunnableStatus
+
+
+def get_llm(**kwargs) -> OpenAI:
+    return OpenAI(
+        name="OpenAI",
+        model="gpt-4o-mini",
+        connection=connections.OpenAI(id=str(uuid.uuid4()), api_key="api-key"),
+        prompt=prompts.Prompt(messages=[prompts.Message(role="user", content="{{input}}")]),
+        **kwargs,
+    )
+
+
+def get_stream_chunk(content: str | None = None, tool_calls: list[dict] | None = None, usage: Usage | None = None):
+    chunk = ModelResponse(stream=True)
+    chunk.choices[0].delta = Delta(role="assistant", content=content, tool_calls=tool_calls)
+    if usage is not None:
+        chunk.usage = usage
+    return chunk
+
+
+def get_tool_call_delta(arguments: str, name: str | None = None) -> list[dict]:
+    function = {"name": name, "arguments": arguments}
+    return [{"id": "call_1" if name else None, "type": "function", "index": 0, "function": function}]
+
+
+def test_completion_params_reset_on_copy():
+    llm = get_llm(temperature=0.1)
+    assert llm.completion_params["temperature"] == 0.1
+
+    llm_copy = llm.model_copy(update={"temperature": 0, "max_tokens": 10})
+    assert llm_copy.completion_params["temperature"] == 0
+    assert llm_copy.completion_params["max_tokens"] == 10
+    assert llm.completion_params["temperature"] == 0.1
+
+
+def test_completion_params_reset_on_field_update():
+    llm = get_llm(temperature=0.1)
+    assert llm.completion_params["temperature"] == 0.1
+    assert llm.completion_params is llm.completion_params
+
+    llm.temperature = 0
+    llm.seed = 42
+    assert llm.completion_params["temperature"] == 0
+    assert llm.completion_params["seed"] == 42
+    assert llm.completion_params["drop_params"] is True
+
+
+@pytest.mark.parametrize(
+    ("chunks", "expected_content", "expected_tool_calls"),
+    [
+        ([get_stream_chunk(c) for c in "plain stream"], "plain stream", None),
+        (
+            [
+                get_stream_chunk("A"),
+                get_stream_chunk("a"),
+                get_stream_chunk("B", usage=Usage(prompt_tokens=3, completion_tokens=3, total_tokens=6)),
+                get_stream_chunk("C"),
+                get_stream_chunk("c"),
+            ],
+            "AaBCc",
+            None,
+        ),
+        (
+            [
+                get_stream_chunk(tool_calls=get_tool_call_delta('{"query"', name="search")),
+                get_stream_chunk(tool_calls=get_tool_call_delta(': "AI"}')),
+            ],
+            None,
+            [{"name": "search", "arguments": '{"query": "AI"}'}],
+        ),
+    ],
+)
+def test_streaming_response_keeps_content_order(mock_llm_executor, chunks, expected_content, expected_tool_calls):
+    mock_llm_executor.side_effect = lambda *args, **kwargs: iter(chunks)
+    llm = get_llm(streaming=StreamingConfig(enabled=True))
+
+    result = llm.run(input_data={"input": "Hi"})
+
+    assert result.status == RunnableStatus.SUCCESS
+    assert result.output["content"] == expected_content
+    tool_calls = result.output["tool_calls"]
+    if expected_tool_calls is None:
+        assert tool_calls is None
+    else:
+        assert [tool_call["function"] for tool_call in tool_calls] == expected_tool_calls
+
+
+@pytest.mark.parametrize(
+    ("model", "prompt_tokens", "completion_tokens"),
+    [
+        ("gpt-4o-mini", 200_000, 1_000),
+        ("gemini/gemini-1.5-pro", 1_000, 100),
+        ("gemini/gemini-1.5-pro", 200_000, 1_000),
+        ("gemini/gemini-1.5-flash", 200_000, 1_000),
+    ],
+)
+def test_usage_data_cost_matches_litellm(model, prompt_tokens, completion_tokens):
+    completion = ModelResponse(
+        usage=Usage(
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            total_tokens=prompt_tokens + completion_tokens,
+        )
+    )
+    expected_prompt_cost, expected_completion_cost = litellm.cost_per_token(
+        model=model, prompt_tokens=prompt_tokens, completion_tokens=completion_tokens
+    )
+
+    usage_data = OpenAI.get_usage_data(model=model, completion=completion)
+
+    assert usage_data.prompt_tokens_cost_usd == pytest.approx(expected_prompt_cost)
+    assert usage_data.completion_tokens_cost_usd == pytest.approx(expected_completion_cost)